@@ -7,6 +7,7 @@ import logging
 from collections.abc import Awaitable, Callable
 
 import nextcord
+from cachetools import LRUCache
 
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
@@ -22,7 +23,8 @@ bot = nextcord.Client(intents=intents)
 
 # Create cache object to hold bot state
 cache = SimpleNamespace()
-cache.processed_messages = set()
+# (message_id, emoji) reactions already handled; bounded so it doesn't grow for the bot's whole uptime
+cache.processed_messages = LRUCache(maxsize=10_000)
 
 # Set up a module-level logger
 logger = logging.getLogger(__name__)
@@ -87,13 +89,13 @@ async def on_raw_reaction_add(payload: nextcord.RawReactionActionEvent):
             is_devils_advocate = emoji_str == "😈"
 
             if (is_clown or is_country) and message_key not in cache.processed_messages:
-                cache.processed_messages.add(message_key)
+                cache.processed_messages[message_key] = True
                 await process_joke_request(payload, country)
             elif is_wisdom and message_key not in cache.processed_messages:
-                cache.processed_messages.add(message_key)
+                cache.processed_messages[message_key] = True
                 await process_wisdom_request(payload)
             elif is_devils_advocate and message_key not in cache.processed_messages:
-                cache.processed_messages.add(message_key)
+                cache.processed_messages[message_key] = True
                 await process_devils_advocate_request(payload)
             elif is_thumbs_down:
                 await retract_joke(payload)
@@ -14,6 +14,61 @@ from opentelemetry.trace import SpanKind
 
 logger = logging.getLogger(__name__)
 
+# Static part of the joke prompt, built once instead of on every generate_joke call
+JOKE_FORMATS = """<formats>
+<format name="ur-mom-classic">
+The canonical "ur mom" joke: "ur mom so [TRAIT] that [CONSEQUENCE]".
+Pick a trait from the message and exaggerate it to absurd extremes.
+The consequence must be a specific, visual scenario that would
+logically follow if the trait were literally true — it should
+feel like creative evidence, not a random insult.
+Take the trait in a surprising direction: a fat joke that becomes
+a time joke, a stupid joke that becomes wordplay.
+Use concrete nouns, brand names, and vivid imagery
+in the consequence.
+</format>
+<format name="ur-mom-twist">
+Take the original message and replace exactly one noun phrase
+with "ur mom" with minimal other changes.
+If the predicate has a sexually ambiguous word, replace
+the subject. If the verb suggests physical action,
+replace the object.
+When the message is a question, consider answering it with
+a declarative statement where "ur mom" is the answer,
+echoing the original wording.
+Treat the original message as raw material, not a rigid
+template — flipping negation, reversing meaning, or
+otherwise twisting the message is fair game if it makes
+the joke land.
+The fewer words changed, the better — the joke's power is
+the audience recognizing the original sentence and seeing
+the double meaning they missed.
+</format>
+<format name="twss">
+"That's what she said" — reframe an innocent statement as
+sexual innuendo by appending the phrase. Works when the
+message contains words or phrases that have a mundane meaning
+in context but could also describe a sexual act, physical
+sensation, or bodily attribute. The wider the gap between
+the innocent intent and the sexual reading, the funnier.
+The double meaning must be instantly apparent — if it
+requires explanation, pick a different format.
+Can be just the phrase, or a short setup echoing the message
+followed by "...that's what she said."
+</format>
+<format name="freestyle">
+Escape hatch: if the message has no trait worth exaggerating,
+no natural "ur mom" substitution, and no double meaning for
+TWSS — don't force it. Fall back to any joke style that fits
+the context: a roast, a pun, a one-liner, an absurdist
+non-sequitur, etc.
+</format>
+</formats>"""
+
+RUSSIAN_NOTE = (
+    " In Russian, use the slang form 'твоя мамка' in the correct case for the sentence (e.g. твою мамку, твоей мамке)."
+)
+
 
 class JokeGenerator:
     def __init__(
@@ -59,10 +114,14 @@ class JokeGenerator:
         # Format sample jokes as XML examples
         examples_xml = ""
         if sample_jokes:
-            examples_xml = "<examples>"
-            for message, joke in sample_jokes:
-                examples_xml += f"<example><message>{message}</message><joke>{joke}</joke></example>"
-            examples_xml += "</examples>"
+            examples_xml = (
+                "<examples>"
+                + "".join(
+                    f"<example><message>{message}</message><joke>{joke}</joke></example>"
+                    for message, joke in sample_jokes
+                )
+                + "</examples>"
+            )
 
         conversation = await conversation_fetcher()
         conversation_block = await self._conversation_formatter.format_to_xml(guild_id, conversation)
@@ -70,7 +129,7 @@ class JokeGenerator:
         memories_block = await self._memory_manager.build_memory_prompt(guild_id, user_ids)
 
         # Create the prompt using format string
-        russian_note = " In Russian, use the slang form 'твоя мамка' in the correct case for the sentence (e.g. твою мамку, твоей мамке)." if language == "ru" else ""
+        russian_note = RUSSIAN_NOTE if language == "ru" else ""
         prompt = f"""You are a chatbot that generates jokes in response to messages.
 Read the message, conversation context, and any user memories,
 then pick whichever joke format below produces the funniest
@@ -78,55 +137,7 @@ result. All formats are equally valid — always go with the
 joke that lands hardest regardless of format.
 Freestyle is a last resort for when nothing else fits.
 
-<formats>
-<format name="ur-mom-classic">
-The canonical "ur mom" joke: "ur mom so [TRAIT] that [CONSEQUENCE]".
-Pick a trait from the message and exaggerate it to absurd extremes.
-The consequence must be a specific, visual scenario that would
-logically follow if the trait were literally true — it should
-feel like creative evidence, not a random insult.
-Take the trait in a surprising direction: a fat joke that becomes
-a time joke, a stupid joke that becomes wordplay.
-Use concrete nouns, brand names, and vivid imagery
-in the consequence.
-</format>
-<format name="ur-mom-twist">
-Take the original message and replace exactly one noun phrase
-with "ur mom" with minimal other changes.
-If the predicate has a sexually ambiguous word, replace
-the subject. If the verb suggests physical action,
-replace the object.
-When the message is a question, consider answering it with
-a declarative statement where "ur mom" is the answer,
-echoing the original wording.
-Treat the original message as raw material, not a rigid
-template — flipping negation, reversing meaning, or
-otherwise twisting the message is fair game if it makes
-the joke land.
-The fewer words changed, the better — the joke's power is
-the audience recognizing the original sentence and seeing
-the double meaning they missed.
-</format>
-<format name="twss">
-"That's what she said" — reframe an innocent statement as
-sexual innuendo by appending the phrase. Works when the
-message contains words or phrases that have a mundane meaning
-in context but could also describe a sexual act, physical
-sensation, or bodily attribute. The wider the gap between
-the innocent intent and the sexual reading, the funnier.
-The double meaning must be instantly apparent — if it
-requires explanation, pick a different format.
-Can be just the phrase, or a short setup echoing the message
-followed by "...that's what she said."
-</format>
-<format name="freestyle">
-Escape hatch: if the message has no trait worth exaggerating,
-no natural "ur mom" substitution, and no double meaning for
-TWSS — don't force it. Fall back to any joke style that fits
-the context: a roast, a pun, a one-liner, an absurdist
-non-sequitur, etc.
-</format>
-</formats>
+{JOKE_FORMATS}
 
 Pick ONE format, commit to it, and deliver the joke.{russian_note}
 Use wordplay, double meanings, and vivid imagery for maximum effect.
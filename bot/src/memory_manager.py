@@ -12,7 +12,7 @@ from conversation_graph import ConversationMessage
 from message_node import MessageNode
 from open_telemetry import Telemetry
 from redis_cache import RedisCache
-from schemas import MemoryContext, DailySummaries, UserAliases
+from schemas import MemoryContext, DailySummaries, UserAliases, BatchAliases
 from store import Store
 from user_resolver import UserResolver
 
@@ -54,11 +54,7 @@ Keep each summary in the third person.
 Return a list of summaries, one for each active user.
 """
 
-EXTRACT_ALIASES_PROMPT = """
-Extract all known real names, nicknames, and alternative names for this user from their factual memory.
-
-Only extract names that clearly identify the same person. Do not extract generic descriptions, roles, or locations.
-
+ALIAS_EXAMPLES = """
 Examples:
 - "He is Sergey" → ["Sergey"]
 - "Also known as Медвед, real name is Pierre" → ["Медвед", "Pierre"]
@@ -68,6 +64,22 @@ Examples:
 - "Его ник в плексе naruto" → ["naruto"]
 """
 
+EXTRACT_ALIASES_PROMPT = f"""
+Extract all known real names, nicknames, and alternative names for this user from their factual memory.
+
+Only extract names that clearly identify the same person. Do not extract generic descriptions, roles, or locations.
+{ALIAS_EXAMPLES}"""
+
+BATCH_EXTRACT_ALIASES_PROMPT = f"""
+Extract all known real names, nicknames, and alternative names for each member from their factual memory.
+
+Only extract names that clearly identify the same person. Do not extract generic descriptions, roles, or locations.
+Take each member's names only from their own <facts>; never attribute a name to a different member.
+{ALIAS_EXAMPLES}
+Return one entry per member, with member_index set to the member's index attribute
+and an empty list for members who have no names.
+"""
+
 STALENESS_THRESHOLD = timedelta(hours=1)
 
 
@@ -79,6 +91,25 @@ class CachedDailySummary:
     created_at: datetime
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _summaries_hash(daily_summaries: dict[date, str]) -> str:
+    """Content hash of daily summaries, streamed into the digest without building a joined string.
+
+    Each entry is framed as its date ordinal plus a length-prefixed summary, so adjacent
+    summaries can't run together into the same bytes.
+    """
+    digest = hashlib.md5()
+    for day, summary in sorted(daily_summaries.items()):
+        encoded = summary.encode()
+        digest.update(day.toordinal().to_bytes(4, "little"))
+        digest.update(len(encoded).to_bytes(4, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
 class MemoryManager:
     def __init__(
         self,
@@ -90,6 +121,7 @@ class MemoryManager:
         user_resolver: UserResolver,
         redis_cache: RedisCache,
         timeout: float | None = 1.0,
+        clock: Callable[[], datetime] | None = None,
     ):
         self._telemetry = telemetry
         self._store = store
@@ -99,9 +131,12 @@ class MemoryManager:
         self._user_resolver = user_resolver
         self._redis_cache = redis_cache
         self._timeout = timeout
+        # Source of "now" (UTC-aware) for current-day and staleness decisions; injectable for tests
+        self._clock = clock or _utc_now
         # In-process single-flight registries: concurrent callers for the same key await one
         # shared build instead of recomputing it. Valid because the bot is a single event loop.
         self._date_inflight: dict[tuple[int, date], asyncio.Task[dict[int, str]]] = {}
+        self._date_read_inflight: dict[tuple[int, date], asyncio.Task[tuple[dict[int, str], datetime] | None]] = {}
         self._member_inflight: dict[tuple[int, int], asyncio.Task[str | None]] = {}
 
     def _coalesce(self, registry: dict, key: tuple, factory: Callable[[], Awaitable]) -> asyncio.Task:
@@ -192,7 +227,7 @@ class MemoryManager:
             span.set_attribute("guild_id", guild_id)
             span.set_attribute("user_id", user_id)
 
-            today = datetime.now(timezone.utc).date()
+            today = self._clock().date()
             all_dates = [today] + [today - timedelta(days=i) for i in range(1, 7)]
             daily_summaries_by_date = await self._fetch_all_daily_summaries(guild_id, all_dates)
 
@@ -248,13 +283,18 @@ class MemoryManager:
             span.set_attribute("guild_id", guild_id)
             span.set_attribute("for_date", str(for_date))
 
-            is_current_day = for_date == datetime.now(timezone.utc).date()
+            is_current_day = for_date == self._clock().date()
 
             if is_current_day:
-                cached = await self._redis_cache.get_daily_summary(guild_id, for_date)
+                # Concurrent reads of the same day share one Redis GET as well as one rebuild
+                cached = await self._coalesce(
+                    self._date_read_inflight,
+                    (guild_id, for_date),
+                    lambda: self._redis_cache.get_daily_summary(guild_id, for_date),
+                )
                 if cached is not None:
                     summaries, created_at = cached
-                    if datetime.now(timezone.utc) - created_at < STALENESS_THRESHOLD:
+                    if self._clock() - created_at < STALENESS_THRESHOLD:
                         span.set_attribute("cache_hit", True)
                         self._telemetry.metrics.daily_summary_jobs.add(
                             1, {"guild_id": str(guild_id), "cache_outcome": "hit", "outcome": "success"}
@@ -291,7 +331,7 @@ class MemoryManager:
             span.set_attribute("guild_id", guild_id)
             span.set_attribute("for_date", str(for_date))
 
-            is_current_day = for_date == datetime.now(timezone.utc).date()
+            is_current_day = for_date == self._clock().date()
             try:
                 summaries = await self._create_daily_summaries(guild_id, for_date)
             except BlockedException as blocked:
@@ -305,7 +345,7 @@ class MemoryManager:
                 return {}
 
             if is_current_day:
-                await self._redis_cache.set_daily_summary(guild_id, for_date, summaries, datetime.now(timezone.utc))
+                await self._redis_cache.set_daily_summary(guild_id, for_date, summaries, self._clock())
             else:
                 await self._store.save_daily_summaries(guild_id, for_date, summaries)
             return summaries
@@ -382,8 +422,7 @@ class MemoryManager:
 
             # Create cache key based on content hash of all inputs
             facts_hash = hashlib.md5((facts or "").encode()).hexdigest()
-            summaries_concat = "".join(f"{date}:{summary}" for date, summary in sorted(daily_summaries.items()))
-            summaries_hash = hashlib.md5(summaries_concat.encode()).hexdigest()
+            summaries_hash = _summaries_hash(daily_summaries)
 
             cached = await self._redis_cache.get_memory(guild_id, user_id, facts_hash, summaries_hash)
             if cached is not None:
@@ -433,28 +472,82 @@ class MemoryManager:
     async def _extract_aliases(self, user_facts: dict[int, str]) -> dict[int, list[str]]:
         """Extract known names/aliases from factual memory for identity resolution.
 
-        Processes all users concurrently, each cached by hash(facts).
+        Each user is cached by hash(facts); all cache misses are resolved in one batched request,
+        and members the batch fails or omits fall back to concurrent per-user requests so one
+        member's facts can't cost everyone their aliases.
         """
         async with self._telemetry.async_create_span("extract_aliases") as span:
             span.set_attribute("user_count", len(user_facts))
 
-            async def _extract_for_user(user_id: int, facts: str) -> tuple[int, list[str]]:
-                facts_hash = hashlib.md5(facts.encode()).hexdigest()
+            facts_hashes = {uid: hashlib.md5(facts.encode()).hexdigest() for uid, facts in user_facts.items()}
+            cached = await asyncio.gather(*[self._redis_cache.get_aliases(h) for h in facts_hashes.values()])
+            aliases_map = {uid: aliases for uid, aliases in zip(facts_hashes, cached) if aliases is not None}
+
+            misses = {uid: facts for uid, facts in user_facts.items() if uid not in aliases_map}
+            span.set_attribute("cache_misses", len(misses))
+            if not misses:
+                return aliases_map
+
+            extracted: dict[int, list[str]] = {}
+            if len(misses) > 1:
+                try:
+                    extracted = await self._extract_aliases_batch(misses)
+                except Exception as e:
+                    logger.warning(f"Batch alias extraction failed, retrying per user: {e}")
+                    span.record_exception(e)
+
+            # Members the batch failed or left out are extracted individually, so they still get aliases
+            unresolved = {uid: facts for uid, facts in misses.items() if uid not in extracted}
+            span.set_attribute("per_user_count", len(unresolved))
+            if unresolved:
+                extracted.update(await self._extract_aliases_per_user(unresolved))
+
+            await asyncio.gather(
+                *[self._redis_cache.set_aliases(facts_hashes[uid], aliases) for uid, aliases in extracted.items()]
+            )
+            aliases_map.update(extracted)
+            return aliases_map
 
-                cached = await self._redis_cache.get_aliases(facts_hash)
-                if cached is not None:
-                    return user_id, cached
+    async def _extract_aliases_batch(self, user_facts: dict[int, str]) -> dict[int, list[str]]:
+        """Extract aliases for several users in a single request; members the model omits are left out."""
+        async with self._telemetry.async_create_span("extract_aliases_batch") as span:
+            span.set_attribute("user_count", len(user_facts))
+
+            # Members are labelled by position and mapped back here, so the model never has to echo
+            # 18-digit Discord IDs (a mangled one would silently cost that member their aliases)
+            members = list(user_facts)
+            member_blocks = "\n".join(
+                f'<member index="{index}"><facts>{user_facts[uid]}</facts></member>'
+                for index, uid in enumerate(members, start=1)
+            )
+            response = await self._alias_client.generate_content(
+                message=f"<members>\n{member_blocks}\n</members>",
+                prompt=BATCH_EXTRACT_ALIASES_PROMPT,
+                response_schema=BatchAliases,
+                temperature=0,
+            )
+
+            aliases_map = {
+                members[entry.member_index - 1]: entry.aliases
+                for entry in response.members
+                if 1 <= entry.member_index <= len(members)
+            }
+            span.set_attribute("returned_count", len(aliases_map))
+            return aliases_map
 
+    async def _extract_aliases_per_user(self, user_facts: dict[int, str]) -> dict[int, list[str]]:
+        """Extract aliases with one concurrent request per user; failed users are logged and left out."""
+        async with self._telemetry.async_create_span("extract_aliases_per_user") as span:
+            span.set_attribute("user_count", len(user_facts))
+
+            async def _extract_for_user(user_id: int, facts: str) -> tuple[int, list[str]]:
                 response = await self._alias_client.generate_content(
                     message=facts,
                     prompt=EXTRACT_ALIASES_PROMPT,
                     response_schema=UserAliases,
                     temperature=0,
                 )
-                aliases = response.aliases
-
-                await self._redis_cache.set_aliases(facts_hash, aliases)
-                return user_id, aliases
+                return user_id, response.aliases
 
             results = await asyncio.gather(
                 *[_extract_for_user(uid, facts) for uid, facts in user_facts.items()],
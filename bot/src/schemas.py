@@ -278,3 +278,16 @@ class UserAliases(BaseModel):
     """Schema for extracting known names/aliases from factual memory."""
 
     aliases: list[str] = Field(description="Known real names, nicknames, or alternative names for the user")
+
+
+class MemberAliases(BaseModel):
+    """Schema for one member's aliases within a batch extraction."""
+
+    member_index: int = Field(description="The index attribute of the <member> these aliases belong to")
+    aliases: list[str] = Field(description="Known real names, nicknames, or alternative names for the user")
+
+
+class BatchAliases(BaseModel):
+    """Schema for extracting aliases for several members in one request."""
+
+    members: list[MemberAliases] = Field(description="Aliases for every listed member, one entry per member")
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 import re
+import time
+from collections.abc import Callable
 from typing import Optional
-from cachetools import LRUCache
+from cachetools import LRUCache, TTLCache
 
 import nextcord
 from opentelemetry.trace import SpanKind, Status, StatusCode
@@ -10,14 +13,23 @@ from open_telemetry import Telemetry
 
 logger = logging.getLogger(__name__)
 
+# Discord user mentions: <@user_id> and the legacy nickname form <@!user_id>
+_MENTION_RE = re.compile(r"<@!?(\d+)>", re.ASCII)
+
+# Fallback names are only cached briefly so users who could not be resolved get retried
+FALLBACK_NAME_TTL_SECONDS = 60
+
 
 class UserResolver:
     """Service for resolving user IDs to display names and vice-versa."""
 
-    def __init__(self, telemetry: Telemetry):
-        """Initializes the UserResolver with telemetry."""
+    def __init__(self, telemetry: Telemetry, timer: Callable[[], float] = time.monotonic):
+        """Initializes the UserResolver with telemetry and the clock used to expire fallback names."""
         self._bot: Optional[nextcord.Client] = None
         self._display_name_cache = LRUCache(maxsize=500)
+        self._fallback_name_cache = TTLCache(maxsize=500, ttl=FALLBACK_NAME_TTL_SECONDS, timer=timer)
+        # In-process single-flight registry for cache misses; valid because the bot is a single event loop
+        self._lookup_inflight: dict[tuple[int, int], asyncio.Task[str]] = {}
         self.telemetry = telemetry
 
     def set_bot_client(self, bot: nextcord.Client):
@@ -27,27 +39,60 @@ class UserResolver:
             return
         self._bot = bot
         self._display_name_cache.clear()
+        self._fallback_name_cache.clear()
         logger.info("UserResolver initialized with bot client.")
 
     async def get_display_name(self, guild_id: int, user_id: int) -> str:
+        # Cache hits are the bulk of calls and just a dict lookup; only misses, which may reach
+        # the Discord API, are worth a span (hits are still counted by the user_resolution metric)
+        cached_name = self._cached_display_name(guild_id, user_id)
+        if cached_name is not None:
+            return cached_name
+
         async with self.telemetry.async_create_span("get_display_name", SpanKind.CLIENT) as span:
             span.set_attribute("guild_id", guild_id)
             span.set_attribute("user_id", user_id)
-
+            span.set_attribute("cache_hit", False)
             cache_key = (guild_id, user_id)
-            if cache_key in self._display_name_cache:
-                span.set_attribute("cache_hit", True)
-                self.telemetry.metrics.user_resolution.add(
-                    1, {"guild_id": str(guild_id), "cache_outcome": "hit", "outcome": "success"}
-                )
-                return self._display_name_cache[cache_key]
 
-            span.set_attribute("cache_hit", False)
+            # Concurrent misses for the same member share one lookup instead of each hitting the API
+            task = self._lookup_inflight.get(cache_key)
+            if task is None or task.done():
+                task = asyncio.create_task(self._lookup_display_name(guild_id, user_id))
+                self._lookup_inflight[cache_key] = task
+                task.add_done_callback(lambda t: self._discard_lookup(cache_key, t))
+            else:
+                span.set_attribute("coalesced", True)
+            # Shielded so one cancelled caller does not cancel the lookup for the others
+            return await asyncio.shield(task)
+
+    def _cached_display_name(self, guild_id: int, user_id: int) -> str | None:
+        """Return the cached real or fallback name for a member, recording the hit, or None on a miss."""
+        cache_key = (guild_id, user_id)
+        cached_name = self._display_name_cache.get(cache_key) or self._fallback_name_cache.get(cache_key)
+        if cached_name is not None:
+            self.telemetry.metrics.user_resolution.add(
+                1, {"guild_id": str(guild_id), "cache_outcome": "hit", "outcome": "success"}
+            )
+        return cached_name
+
+    def _discard_lookup(self, cache_key: tuple[int, int], task: asyncio.Task) -> None:
+        if self._lookup_inflight.get(cache_key) is task:
+            del self._lookup_inflight[cache_key]
+        if not task.cancelled():
+            task.exception()  # retrieve to suppress "exception was never retrieved" warnings
+
+    async def _lookup_display_name(self, guild_id: int, user_id: int) -> str:
+        """Resolve a display name through the Discord client and cache the outcome."""
+        async with self.telemetry.async_create_span("lookup_display_name", SpanKind.CLIENT) as span:
+            span.set_attribute("guild_id", guild_id)
+            span.set_attribute("user_id", user_id)
+            cache_key = (guild_id, user_id)
 
             if self._bot is None:
                 logger.error("UserResolver has not been initialized with the bot client.")
                 fallback = f"User(ID:{user_id})"
-                self._display_name_cache[cache_key] = fallback
+                self._fallback_name_cache[cache_key] = fallback
                 span.set_status(Status(StatusCode.ERROR, "Bot client not initialized"))
                 self.telemetry.metrics.user_resolution.add(
                     1, {"guild_id": str(guild_id), "outcome": "error", "reason": "bot_uninitialized"}
@@ -58,7 +103,7 @@ class UserResolver:
             if not guild:
                 logger.warning(f"Could not find guild with ID {guild_id}")
                 fallback = f"User(ID:{user_id})"
-                self._display_name_cache[cache_key] = fallback
+                self._fallback_name_cache[cache_key] = fallback
                 span.set_status(Status(StatusCode.ERROR, f"Guild {guild_id} not found"))
                 return fallback
 
@@ -121,7 +166,7 @@ class UserResolver:
             except nextcord.NotFound:
                 logger.warning(f"User {user_id} not found")
                 fallback = f"User(ID:{user_id})"
-                self._display_name_cache[cache_key] = fallback
+                self._fallback_name_cache[cache_key] = fallback
                 span.set_status(Status(StatusCode.ERROR, f"User {user_id} not found"))
                 self.telemetry.metrics.user_resolution.add(
                     1, {"guild_id": str(guild_id), "outcome": "error", "reason": "user_not_found"}
@@ -134,27 +179,41 @@ class UserResolver:
             span.set_attribute("guild_id", guild_id)
             span.set_attribute("text_length", len(text) if text else 0)
 
-            if not text:
+            # Most messages mention nobody; skip the regex scan for them
+            if not text or "<@" not in text:
                 span.set_attribute("mentions_count", 0)
                 return text
 
             # Find all user mentions in the text
-            mention_pattern = r"<@!?(\d+)>"
-            mentions = re.findall(mention_pattern, text)
+            mentions = _MENTION_RE.findall(text)
 
             span.set_attribute("mentions_count", len(mentions))
 
             if not mentions:
                 return text
 
-            # Replace each mention with the actual display name
-            result = text
-            for user_id_str in mentions:
-                user_id = int(user_id_str)
-                display_name = await self.get_display_name(guild_id, user_id)
+            # Cached names are read inline under this span; only misses pay for a per-user
+            # get_display_name span, and those are resolved concurrently. Names are keyed by the
+            # captured id string so the substitution callback below does no int() conversion.
+            names_by_id: dict[str, str] = {}
+            misses: list[str] = []
+            for user_id_str in dict.fromkeys(mentions):
+                cached_name = self._cached_display_name(guild_id, int(user_id_str))
+                if cached_name is None:
+                    misses.append(user_id_str)
+                else:
+                    names_by_id[user_id_str] = cached_name
+            span.set_attribute("cache_hit", not misses)
+            span.set_attribute("cached_mentions", len(names_by_id))
+
+            if misses:
+                display_names = await asyncio.gather(
+                    *(self.get_display_name(guild_id, int(user_id_str)) for user_id_str in misses)
+                )
+                names_by_id.update(zip(misses, display_names))
 
-                # Replace both <@user_id> and <@!user_id> formats
-                result = re.sub(f"<@!?{user_id}>", display_name, result)
+            # Replace both <@user_id> and <@!user_id> formats in a single pass
+            result = _MENTION_RE.sub(lambda match: names_by_id[match.group(1)], text)
 
             span.set_attribute("result_length", len(result))
             return result
@@ -7,6 +7,7 @@ import re
 import shutil
 import tempfile
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from open_telemetry import Telemetry
@@ -45,7 +46,7 @@ class ScaleParams:
 
 
 def _filter_crop_outliers(
-    crop_tuples: list[tuple[int, int, int, int]],
+    crop_tuples: Iterable[tuple[int, int, int, int]],
 ) -> list[tuple[int, int, int, int]]:
     """Remove crop values that appear in fewer than _CROP_MIN_FRAMES frames.
 
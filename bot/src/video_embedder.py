@@ -15,17 +15,16 @@ from video_compressor import VideoCompressionError, VideoCompressor
 
 logger = logging.getLogger(__name__)
 
-# Patterns for supported video URLs
-URL_PATTERNS = [
-    # X/Twitter: https://x.com/user/status/123
-    re.compile(r"https?://(?:www\.)?(?:x|twitter)\.com/\w+/status/\d+"),
-    # Instagram Reels: https://www.instagram.com/reel/ABC123/
-    re.compile(r"https?://(?:www\.)?instagram\.com/reel/[\w-]+"),
-    # Reddit: https://www.reddit.com/r/subreddit/...
-    re.compile(r"https?://(?:www\.)?reddit\.com/r/[\w/]+"),
-    # Reddit short links: https://redd.it/id
-    re.compile(r"https?://redd\.it/\w+"),
-]
+# Supported video URLs, combined into one alternation so a message is scanned once
+URL_PATTERN = re.compile(
+    r"""
+    https?://(?:www\.)?(?:x|twitter)\.com/\w+/status/\d+      # X/Twitter: https://x.com/user/status/123
+    | https?://(?:www\.)?instagram\.com/reel/[\w-]+           # Instagram Reels: https://www.instagram.com/reel/ABC123/
+    | https?://(?:www\.)?reddit\.com/r/[\w/]+                 # Reddit: https://www.reddit.com/r/subreddit/...
+    | https?://redd\.it/\w+                                   # Reddit short links: https://redd.it/id
+    """,
+    re.VERBOSE,
+)
 
 # 10MB limit for Discord attachments (non-Nitro)
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024
@@ -80,12 +79,12 @@ class VideoEmbedder:
             text: Message text to search
 
         Returns:
-            List of matching URLs
+            List of matching URLs, in the order they appear
         """
-        urls = []
-        for pattern in URL_PATTERNS:
-            urls.extend(pattern.findall(text))
-        return urls
+        # Most messages carry no links at all; skip the regex scan for them
+        if "://" not in text:
+            return []
+        return URL_PATTERN.findall(text)
 
     async def process_url(self, url: str) -> VideoEmbed | None:
         """
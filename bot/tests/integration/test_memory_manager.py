@@ -8,7 +8,8 @@ import shutil
 import time
 import unittest
 from dataclasses import dataclass
-from datetime import date
+from collections.abc import Callable
+from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock
 
 from dotenv import load_dotenv
@@ -86,7 +87,7 @@ class MemoryManagerTestBase(unittest.IsolatedAsyncioTestCase):
             self.skipTest("No merge-capable AI clients configured (Gemma required).")
         self.default_merge_profile = self.merge_profiles[0]
 
-    def _build_context(self, profile: Profile) -> MemoryTestContext:
+    def _build_context(self, profile: Profile, clock: Callable[[], datetime] | None = None) -> MemoryTestContext:
         store = TestStore()
         memory_manager = MemoryManager(
             telemetry=self.telemetry,
@@ -97,6 +98,7 @@ class MemoryManagerTestBase(unittest.IsolatedAsyncioTestCase):
             user_resolver=store.user_resolver,
             redis_cache=NullRedisCache(),
             timeout=None,
+            clock=clock,
         )
         return MemoryTestContext(
             memory_manager=memory_manager,
@@ -204,20 +206,15 @@ class TestMemoryManagerIntegration(MemoryManagerTestBase):
             "and quantum mechanics contributions"
         )
 
-        from unittest.mock import patch
-        from datetime import datetime, timezone
+        now = datetime(1905, 3, 6, 14, 30, tzinfo=timezone.utc)
 
         for profile in self.merge_profiles:
             with self.subTest(profile=profile.name):
-                ctx = self._build_context(profile)
+                ctx = self._build_context(profile, clock=lambda: now)
                 einstein_id = ctx.store.physicist_ids["Einstein"]
                 ctx.store.set_user_facts(ctx.store.physics_guild_id, einstein_id, einstein_facts)
 
-                with patch("memory_manager.datetime") as mock_datetime:
-                    mock_datetime.now.return_value = datetime(1905, 3, 6, 14, 30, tzinfo=timezone.utc)
-                    mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-                    result = await ctx.memory_manager.get_memory(ctx.store.physics_guild_id, einstein_id)
+                result = await ctx.memory_manager.get_memory(ctx.store.physics_guild_id, einstein_id)
 
                 self.assertIsNotNone(result, "Should generate complete memory context")
                 self.assertGreater(len(result), 100, "Complete memory should be substantial")
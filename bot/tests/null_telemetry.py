@@ -1,6 +1,29 @@
-from contextlib import asynccontextmanager, contextmanager
 from types import SimpleNamespace
 
+# Spans are write-only no-ops, so every span context can yield the same object
+_NULL_SPAN = SimpleNamespace(
+    set_attribute=lambda *args: None, set_status=lambda *args: None, record_exception=lambda *args: None
+)
+
+
+class _NullSpanContext:
+    """Stateless sync/async context manager yielding _NULL_SPAN, so entering a span allocates nothing."""
+
+    def __enter__(self):
+        return _NULL_SPAN
+
+    def __exit__(self, *exc_info):
+        return None
+
+    async def __aenter__(self):
+        return _NULL_SPAN
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+_NULL_SPAN_CONTEXT = _NullSpanContext()
+
 
 class NullTelemetry:
     """A no-op implementation of Telemetry for testing"""
@@ -40,19 +63,13 @@ class NullTelemetry:
             timer=_timer,
         )
 
-    @contextmanager
     def create_span(self, name, kind=None, attributes=None):
         """No-op span for synchronous code"""
-        yield SimpleNamespace(
-            set_attribute=lambda *args: None, set_status=lambda *args: None, record_exception=lambda *args: None
-        )
+        return _NULL_SPAN_CONTEXT
 
-    @asynccontextmanager
-    async def async_create_span(self, name, kind=None, attributes=None, require_parent=False):
+    def async_create_span(self, name, kind=None, attributes=None, require_parent=False):
         """No-op span for async code"""
-        yield SimpleNamespace(
-            set_attribute=lambda *args: None, set_status=lambda *args: None, record_exception=lambda *args: None
-        )
+        return _NULL_SPAN_CONTEXT
 
     def increment_message_counter(self, *args, **kwargs):
         pass
@@ -4,6 +4,7 @@ This provides realistic conversation data for testing memory systems.
 """
 
 import re
+from collections import defaultdict
 from datetime import datetime, timezone, date
 from store import Store, ChatMessage
 from test_user_resolver import TestUserResolver
@@ -12,14 +13,25 @@ from test_user_resolver import TestUserResolver
 class TestStore(Store):
     """Test double Store pre-populated with physics revolution chat history."""
 
+    # Parsed once per process; ChatMessage objects are never mutated, so instances share them
+    _physics_chat_history: tuple[ChatMessage, ...] | None = None
+
     def __init__(self):
         # Don't call super().__init__() since we don't need real database
         self.user_resolver = TestUserResolver()
         self.physics_guild_id = self.user_resolver.physics_guild_id
         self.physicist_ids = self.user_resolver.physicist_ids
 
-        # Parse and store the physics chat history
-        self._messages = self._parse_physics_chat_history()
+        # Parse the physics chat history once, then give each store its own list so
+        # add_chat_message on one instance doesn't leak into another
+        if TestStore._physics_chat_history is None:
+            TestStore._physics_chat_history = tuple(self._parse_physics_chat_history())
+        self._messages = list(TestStore._physics_chat_history)
+
+        # Messages indexed by calendar date, the only key the per-date lookups filter on
+        self._messages_by_date: defaultdict[date, list[ChatMessage]] = defaultdict(list)
+        for message in self._messages:
+            self._messages_by_date[message.timestamp.date()].append(message)
 
         # Store for user facts (empty by default for testing)
         self._user_facts = {}
@@ -464,13 +476,7 @@ class TestStore(Store):
         if guild_id != self.physics_guild_id:
             return []
 
-        # Filter messages by date
-        filtered_messages = []
-        for message in self._messages:
-            if message.timestamp.date() == for_date:
-                filtered_messages.append(message)
-
-        return filtered_messages
+        return list(self._messages_by_date.get(for_date, ()))
 
     async def get_user_facts(self, guild_id: int, user_id: int) -> str | None:
         """Get stored facts for a user."""
@@ -499,6 +505,7 @@ class TestStore(Store):
             reply_to_id=reply_to_id,
         )
         self._messages.append(message)
+        self._messages_by_date[timestamp.date()].append(message)
 
     def set_user_facts(self, guild_id: int, user_id: int, facts: str) -> None:
         """Set facts for a user (test helper method)."""
@@ -511,18 +518,22 @@ class TestStore(Store):
 
     def get_message_count_for_date(self, for_date: date) -> int:
         """Get count of messages for a specific date (test helper)."""
-        count = 0
-        for message in self._messages:
-            if message.timestamp.date() == for_date:
-                count += 1
-        return count
+        return len(self._messages_by_date.get(for_date, ()))
+
+    def find_message(self, for_date: date, user_id: int, contains: str) -> ChatMessage | None:
+        """Find the first message by a user on a date whose text contains a substring (test helper)."""
+        return next(
+            (
+                message
+                for message in self._messages_by_date.get(for_date, ())
+                if message.user_id == user_id and contains in message.message_text
+            ),
+            None,
+        )
 
     def get_active_physicists_for_date(self, for_date: date) -> list[str]:
         """Get list of physicist names active on a specific date (test helper)."""
-        active_user_ids = set()
-        for message in self._messages:
-            if message.timestamp.date() == for_date:
-                active_user_ids.add(message.user_id)
+        active_user_ids = {message.user_id for message in self._messages_by_date.get(for_date, ())}
 
         # Convert back to names
         physicist_names = []
@@ -550,8 +561,7 @@ class TestStore(Store):
 
     async def has_chat_messages_for_date(self, guild_id: int, for_date: date) -> bool:
         """Check if any chat messages exist for a specific guild and date (test implementation)."""
-        messages = await self.get_chat_messages_for_date(guild_id, for_date)
-        return len(messages) > 0
+        return guild_id == self.physics_guild_id and bool(self._messages_by_date.get(for_date))
 
     async def get_daily_summaries(self, guild_id: int, for_date: date) -> dict[int, str]:
         """Get daily summaries for all users on a specific date (test implementation)."""
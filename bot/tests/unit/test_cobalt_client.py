@@ -21,8 +21,11 @@ class AsyncContextManager:
 
 
 class TestCobaltClient(unittest.IsolatedAsyncioTestCase):
+    @patch("asyncio.sleep", new_callable=AsyncMock)
     @patch("cobalt_client.aiohttp.ClientSession")
-    async def test_extract_video_retries_on_network_error_then_succeeds(self, mock_session_cls: MagicMock):
+    async def test_extract_video_retries_on_network_error_then_succeeds(
+        self, mock_session_cls: MagicMock, mock_sleep: AsyncMock
+    ):
         tunnel_response = {
             "status": "tunnel",
             "url": "https://cobalt.example.com/tunnel/abc123",
@@ -51,6 +54,8 @@ class TestCobaltClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.url, "https://cobalt.example.com/tunnel/abc123")
         self.assertEqual(result.filename, "twitter_video.mp4")
         self.assertEqual(call_count, 2)
+        # The backoff delay between attempts is skipped rather than slept for real
+        mock_sleep.assert_awaited_once()
 
     @patch("cobalt_client.aiohttp.ClientSession")
     async def test_extract_video_skips_photos(self, mock_session_cls: MagicMock):
@@ -1,79 +1,126 @@
 import unittest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import AsyncMock, NonCallableMock, patch
 from datetime import datetime, date, timezone, timedelta
+from types import MappingProxyType
 import asyncio
+import hashlib
 
 from memory_manager import MemoryManager
-from ai_client import AIClient, BlockedException
+from ai_client import BlockedException
 from message_node import MessageNode
-from schemas import MemoryContext, DailySummaries, UserSummary, UserAliases
+from schemas import MemoryContext, DailySummaries, UserSummary, UserAliases, BatchAliases, MemberAliases
 from store import Store
 from null_redis_cache import NullRedisCache
 from null_telemetry import NullTelemetry
 from test_user_resolver import TestUserResolver
-from test_store import TestStore  # Moved import to top
+from test_store import TestStore
 
 
-class TestMemoryManagerCaching(unittest.IsolatedAsyncioTestCase):
-    """Test cache behavior and key generation for MemoryManager."""
+class _StubAIClient:
+    """AI client double: MemoryManager only awaits ``generate_content``, so no spec'd mock is needed."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
+    def __init__(self):
+        self.generate_content = AsyncMock()
+
+
+class _FrozenClock:
+    """Clock for ``MemoryManager(clock=...)``: returns whatever the test last assigned to ``current``."""
+
+    def __init__(self, current: datetime | None = None):
+        self.current = current
+
+    def __call__(self) -> datetime:
+        return self.current
+
+
+class _MemoryManagerTestBase(unittest.IsolatedAsyncioTestCase):
+    """Shared fixture: physicist test doubles, mock AI clients, and the MemoryManager under test.
+
+    Classes exercising the physics chat history keep ``use_test_store``; those that stub storage
+    per test set it to False and get a ``Store`` mock as ``self.mock_store`` instead.
+
+    Only the stateless telemetry double and the read-only physicist roster are built once per class.
+    Stores, caches, mocks and the manager itself carry per-test state (saved summaries, coalescing
+    registries, call history), so they are rebuilt in ``setUp``.
+    """
 
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
+    use_test_store = True
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.telemetry = NullTelemetry()
+        # Test data - Physics Guild with real physicist IDs
+        cls.user_resolver = TestUserResolver()
+        cls.physics_guild_id = cls.user_resolver.physics_guild_id
+        cls.physicist_ids = cls.user_resolver.physicist_ids
+        cls.einstein_id = cls.physicist_ids["Einstein"]
+
+    def setUp(self):
         self.redis_cache = NullRedisCache()
 
+        if self.use_test_store:
+            # Use TestStore for realistic data and interactions
+            self.test_store = TestStore()
+        else:
+            # Only its methods are called, and spec_set rejects stubbing a method Store doesn't have
+            self.mock_store = NonCallableMock(spec_set=Store)
+
         # Mock AI clients
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
+        self.mock_summary_client = _StubAIClient()
+        self.mock_alias_client = _StubAIClient()
+        self.mock_merge_client = _StubAIClient()
 
         # Component under test
-        self.memory_manager = MemoryManager(
+        self.memory_manager = self._manager()
+
+    def _manager(self, timeout: float | None = 1.0, clock: _FrozenClock | None = None) -> MemoryManager:
+        return MemoryManager(
             telemetry=self.telemetry,
-            store=self.test_store,
+            store=self.test_store if self.use_test_store else self.mock_store,
             summary_client=self.mock_summary_client,
             alias_client=self.mock_alias_client,
             merge_client=self.mock_merge_client,
             user_resolver=self.user_resolver,
             redis_cache=self.redis_cache,
+            timeout=timeout,
+            clock=clock,
         )
 
-        # Test data - Physics Guild with real physicist IDs
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+    def _freeze_clock(self, current: datetime | None = None) -> _FrozenClock:
+        """Swap in a manager on a frozen clock; move time by setting the returned clock's ``current``."""
+        clock = _FrozenClock(current)
+        self.memory_manager = self._manager(clock=clock)
+        return clock
+
+
+class TestMemoryManagerCaching(_MemoryManagerTestBase):
+    """Test cache behavior and key generation for MemoryManager."""
+
+    def setUp(self):
+        super().setUp()
         self.test_date = date(1905, 3, 3)  # March 3, 1905 - Annus Mirabilis year
 
     async def test_historical_daily_cache_hit(self):
         """Test that historical daily summary cache hits for same guild/date, avoiding AI calls."""
-        # Arrange - Use TestStore for realistic database behavior
-        from test_store import TestStore
-
-        test_store = TestStore()
-        self.memory_manager._store = test_store  # Replace mock store with real test double
-
-        # Use a date that has messages in TestStore to make the test realistic
+        # Arrange - Use a date that has messages in TestStore to make the test realistic
         historical_date = date(1905, 3, 4)
         bohr_id = self.physicist_ids["Bohr"]
         expected_summary = "Bohr proposed quantized atomic energy levels to explain hydrogen spectra"
         expected_summaries = {bohr_id: expected_summary}
 
         # Pre-populate the "database" with the summary to simulate a cache hit
-        await test_store.save_daily_summaries(self.physics_guild_id, historical_date, expected_summaries)
+        await self.test_store.save_daily_summaries(self.physics_guild_id, historical_date, expected_summaries)
 
         # Ensure the AI client mock is clean before the test action
         self.mock_summary_client.generate_content.reset_mock()
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            # Set current time to be after the historical date
-            mock_datetime.now.return_value = datetime(1905, 3, 5, 12, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        # Set current time to be after the historical date
+        self._freeze_clock(datetime(1905, 3, 5, 12, 0, tzinfo=timezone.utc))
 
-            # Act - A single call should be sufficient to test the database cache
-            daily_summaries = await self.memory_manager._daily_summary(self.physics_guild_id, historical_date)
-            result = daily_summaries.get(bohr_id)
+        # Act - A single call should be sufficient to test the database cache
+        daily_summaries = await self.memory_manager._daily_summary(self.physics_guild_id, historical_date)
+        result = daily_summaries.get(bohr_id)
 
         # Assert
         self.assertEqual(result, expected_summary)
@@ -88,12 +135,10 @@ class TestMemoryManagerCaching(unittest.IsolatedAsyncioTestCase):
         historical = "Einstein has been developing revolutionary theories about space, time, and energy"
 
         # Mock returns handled by TestUserResolver automatically
-        self.mock_merge_client.generate_content = AsyncMock(
-            return_value=MemoryContext(
-                context=(
-                    "Einstein is a revolutionary physicist who challenges classical physics"
-                    " with quantum and relativity theories"
-                )
+        self.mock_merge_client.generate_content.return_value = MemoryContext(
+            context=(
+                "Einstein is a revolutionary physicist who challenges classical physics"
+                " with quantum and relativity theories"
             )
         )
 
@@ -123,8 +168,8 @@ class TestMemoryManagerCaching(unittest.IsolatedAsyncioTestCase):
         historical = "Bohr has been developing new atomic theories that explain spectral lines"
 
         # Mock returns handled by TestUserResolver automatically
-        self.mock_merge_client.generate_content = AsyncMock(
-            return_value=MemoryContext(context="Bohr is revolutionizing atomic physics with quantum orbital theory")
+        self.mock_merge_client.generate_content.return_value = MemoryContext(
+            context="Bohr is revolutionizing atomic physics with quantum orbital theory"
         )
 
         # Act - Two calls with evolving facts about Bohr's discoveries
@@ -150,35 +195,10 @@ class TestMemoryManagerCaching(unittest.IsolatedAsyncioTestCase):
         self.mock_summary_client.generate_content.assert_not_called()
 
 
-class TestMemoryManagerFallbacks(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerFallbacks(_MemoryManagerTestBase):
     """Test fallback logic and error handling for MemoryManager."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Real test double with physicists
-        self.user_resolver = TestUserResolver()
-
-        # Mock AI clients and store
-        self.mock_store = Mock(spec=Store)
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-
-        # Component under test
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.mock_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
-        )
-
-        # Test data - Physics Guild with real physicist IDs
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+    use_test_store = False
 
     async def test_no_memories_returns_none(self):
         """Test that get_memories returns None when no memories exist."""
@@ -376,35 +396,11 @@ class TestMemoryManagerFallbacks(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result, facts)
 
 
-class TestMemoryManagerDataProcessing(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerDataProcessing(_MemoryManagerTestBase):
     """Test data processing and formatting for MemoryManager."""
 
     def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-
-        # Mock AI clients
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-
-        # Component under test
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
-        )
-
-        # Test data - Physics Guild with real physicist IDs
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+        super().setUp()
         self.test_date = date(1905, 3, 3)  # March 3, 1905 - Annus Mirabilis year
 
     async def test_message_formatting_xml_structure(self):
@@ -412,12 +408,8 @@ class TestMemoryManagerDataProcessing(unittest.IsolatedAsyncioTestCase):
         # Arrange
         einstein_id = self.physicist_ids["Einstein"]
 
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[
-                    UserSummary(user_id=einstein_id, summary="Einstein discussed quantum hypothesis with Planck")
-                ]
-            )
+        self.mock_summary_client.generate_content.return_value = DailySummaries(
+            summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed quantum hypothesis with Planck")]
         )
 
         # Act
@@ -448,13 +440,11 @@ class TestMemoryManagerDataProcessing(unittest.IsolatedAsyncioTestCase):
         einstein_id = self.physicist_ids["Einstein"]
         bohr_id = self.physicist_ids["Bohr"]
 
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[
-                    UserSummary(user_id=einstein_id, summary="Einstein discussed quantum theory"),
-                    UserSummary(user_id=bohr_id, summary="Bohr proposed quantized energy levels"),
-                ]
-            )
+        self.mock_summary_client.generate_content.return_value = DailySummaries(
+            summaries=[
+                UserSummary(user_id=einstein_id, summary="Einstein discussed quantum theory"),
+                UserSummary(user_id=bohr_id, summary="Bohr proposed quantized energy levels"),
+            ]
         )
 
         # Act
@@ -512,31 +502,9 @@ class TestMemoryManagerDataProcessing(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(added_message.timestamp, message.created_at)
 
 
-class TestMemoryManagerBatchProcessing(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerBatchProcessing(_MemoryManagerTestBase):
     """Test batch processing and concurrent operations for MemoryManager."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
-        )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
-
     async def test_get_memories_batch_processing_multiple_users(self):
         """Test that get_memories() processes multiple users and returns correct dict mapping."""
         # Arrange
@@ -567,45 +535,58 @@ class TestMemoryManagerBatchProcessing(unittest.IsolatedAsyncioTestCase):
         self.mock_alias_client.generate_content.assert_not_called()
 
     async def test_daily_summary_blocked_returns_empty(self):
-        """Daily summary should return empty dict when AI blocks the request."""
-        historical_date = date(1905, 3, 3)
-        blocked_reason = "PROHIBITED_CONTENT"
+        """Daily summary returns an empty dict when AI blocks the request, persisting it only for past days."""
+        summary_date = date(1905, 3, 3)
 
         # Gemini client refuses to generate content
-        self.mock_summary_client.generate_content = AsyncMock(side_effect=BlockedException(reason=blocked_reason))
+        self.mock_summary_client.generate_content.side_effect = BlockedException(reason="PROHIBITED_CONTENT")
 
-        result = await self.memory_manager._daily_summary(self.physics_guild_id, historical_date)
+        # Same date, seen first as a past day and then as today
+        cases = [
+            ("historical", datetime(1905, 3, 4, 12, 0, tzinfo=timezone.utc)),
+            ("current day", datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)),
+        ]
+        for day, now in cases:
+            with self.subTest(day=day):
+                self._freeze_clock(now)
+                self.mock_summary_client.generate_content.reset_mock()
+
+                result = await self.memory_manager._daily_summary(self.physics_guild_id, summary_date)
 
-        self.assertEqual(result, {}, "Blocked summaries should return empty dict")
-        self.mock_summary_client.generate_content.assert_awaited_once()
-        # Store should persist the empty result to avoid retries
-        stored = await self.test_store.get_daily_summaries(self.physics_guild_id, historical_date)
-        self.assertEqual(stored, {})
+                self.assertEqual(result, {}, "Blocked summaries should return empty dict")
+                self.mock_summary_client.generate_content.assert_awaited_once()
 
+                if day == "historical":
+                    # Store persists the empty result so a refused generation isn't retried forever
+                    self.assertEqual(self.test_store._daily_summaries[(self.physics_guild_id, summary_date)], {})
+                else:
+                    # Today is left uncached so the next read attempts a rebuild
+                    self.assertIsNone(await self.redis_cache.get_daily_summary(self.physics_guild_id, summary_date))
 
-class TestMemoryManagerExceptionIsolation(unittest.IsolatedAsyncioTestCase):
+
+class TestMemoryManagerExceptionIsolation(_MemoryManagerTestBase):
     """Test exception isolation and graceful degradation in concurrent processing."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-        self.user_resolver = TestUserResolver()
-        self.mock_store = Mock(spec=Store)
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.mock_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
+    use_test_store = False
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.today = date(1905, 3, 6)
+        cls.all_dates = tuple(cls.today - timedelta(days=i) for i in range(7))
+
+        # Read-only summaries-by-date input: Bohr is only active yesterday
+        einstein_id, bohr_id, planck_id = (cls.physicist_ids[name] for name in ("Einstein", "Bohr", "Planck"))
+        cls.daily_summaries_by_date = MappingProxyType(
+            {
+                cls.today: {einstein_id: "Einstein today", planck_id: "Planck today"},
+                cls.today - timedelta(days=1): {
+                    einstein_id: "Einstein yesterday",
+                    bohr_id: "Bohr yesterday",
+                    planck_id: "Planck yesterday",
+                },
+            }
         )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
-        self.today = date(1905, 3, 6)
-        self.all_dates = [self.today - timedelta(days=i) for i in range(7)]
 
     async def test_daily_summary_failure_doesnt_block_other_dates(self):
         """Test that if one date's daily summary fails, other dates still process."""
@@ -650,22 +631,12 @@ class TestMemoryManagerExceptionIsolation(unittest.IsolatedAsyncioTestCase):
                 raise ValueError("AI merge failed for Bohr")
             return f"Merged context for {user_id}"
 
-        # Create daily summaries for all users
-        daily_summaries_by_date = {
-            self.today: {einstein_id: "Einstein today", planck_id: "Planck today"},
-            self.today - timedelta(days=1): {
-                einstein_id: "Einstein yesterday",
-                bohr_id: "Bohr yesterday",
-                planck_id: "Planck yesterday",
-            },
-        }
-
         with (
             patch.object(
                 self.memory_manager,
                 "_fetch_all_daily_summaries",
                 new_callable=AsyncMock,
-                return_value=daily_summaries_by_date,
+                return_value=self.daily_summaries_by_date,
             ),
             patch.object(self.memory_manager, "_merge_context", side_effect=merge_context_side_effect),
         ):
@@ -682,7 +653,7 @@ class TestMemoryManagerExceptionIsolation(unittest.IsolatedAsyncioTestCase):
 
     async def test_context_merge_failure_isolated_per_user(self):
         """Test that merge failures are handled independently per user."""
-        # Arrange - Test the _create_user_memory method directly instead of using side effects with asyncio.gather
+        # Arrange - Test the _create_user_memory method directly rather than through get_memories
         einstein_id = self.physicist_ids["Einstein"]
         bohr_id = self.physicist_ids["Bohr"]  # Bohr's merge will fail
         planck_id = self.physicist_ids["Planck"]
@@ -694,15 +665,18 @@ class TestMemoryManagerExceptionIsolation(unittest.IsolatedAsyncioTestCase):
             return f"Merged context for {user_id}"
 
         with patch.object(self.memory_manager, "_merge_context", side_effect=merge_context_side_effect):
-            # Act - Test individual user memory creation to verify isolation
-            einstein_result = await self.memory_manager._create_user_memory(
-                self.physics_guild_id, einstein_id, "Einstein facts", {self.today: "Einstein current"}
-            )
-            bohr_result = await self.memory_manager._create_user_memory(
-                self.physics_guild_id, bohr_id, "Bohr facts", {self.today: "Bohr current"}
-            )
-            planck_result = await self.memory_manager._create_user_memory(
-                self.physics_guild_id, planck_id, "Planck facts", {self.today: "Planck current"}
+            # Act - Create all three memories concurrently; Bohr's failure must stay contained in
+            # _create_user_memory, so gather is left to propagate anything that escapes
+            einstein_result, bohr_result, planck_result = await asyncio.gather(
+                self.memory_manager._create_user_memory(
+                    self.physics_guild_id, einstein_id, "Einstein facts", {self.today: "Einstein current"}
+                ),
+                self.memory_manager._create_user_memory(
+                    self.physics_guild_id, bohr_id, "Bohr facts", {self.today: "Bohr current"}
+                ),
+                self.memory_manager._create_user_memory(
+                    self.physics_guild_id, planck_id, "Planck facts", {self.today: "Planck current"}
+                ),
             )
 
             # Assert - Einstein and Planck succeed, Bohr falls back to facts
@@ -711,63 +685,36 @@ class TestMemoryManagerExceptionIsolation(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(planck_result, f"Merged context for {planck_id}")
 
 
-class TestMemoryManagerCacheArchitecture(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerCacheArchitecture(_MemoryManagerTestBase):
     """Test the cache architecture of the MemoryManager."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-        self.redis_cache = NullRedisCache()
-
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=self.redis_cache,
-        )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
-
     async def test_current_day_vs_historical_day_cache_separation(self):
         """Test that current day stores in Redis while historical days store in database."""
         today = date(1905, 3, 6)
         yesterday = date(1905, 3, 5)
         einstein_id = self.physicist_ids["Einstein"]
 
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed physics")]
-            )
+        self.mock_summary_client.generate_content.return_value = DailySummaries(
+            summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed physics")]
         )
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 6, 12, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self._freeze_clock(datetime(1905, 3, 6, 12, 0, tzinfo=timezone.utc))
 
-            # Act - Process both today and yesterday (both built synchronously on miss)
-            await self.memory_manager._daily_summary(self.physics_guild_id, today)
-            yesterday_result = await self.memory_manager._daily_summary(self.physics_guild_id, yesterday)
+        # Act - Process both today and yesterday (both built synchronously on miss)
+        await self.memory_manager._daily_summary(self.physics_guild_id, today)
+        yesterday_result = await self.memory_manager._daily_summary(self.physics_guild_id, yesterday)
 
-            # Assert - Today goes to Redis, NOT database
-            redis_today = await self.redis_cache.get_daily_summary(self.physics_guild_id, today)
-            self.assertIsNotNone(redis_today)
-            stored_today = await self.test_store.get_daily_summaries(self.physics_guild_id, today)
-            self.assertEqual(stored_today, {})
+        # Assert - Today goes to Redis, NOT database
+        redis_today = await self.redis_cache.get_daily_summary(self.physics_guild_id, today)
+        self.assertIsNotNone(redis_today)
+        stored_today = await self.test_store.get_daily_summaries(self.physics_guild_id, today)
+        self.assertFalse(stored_today)
 
-            # Assert - Yesterday goes to database, NOT Redis
-            redis_yesterday = await self.redis_cache.get_daily_summary(self.physics_guild_id, yesterday)
-            self.assertIsNone(redis_yesterday)
-            stored_yesterday = await self.test_store.get_daily_summaries(self.physics_guild_id, yesterday)
-            self.assertEqual(stored_yesterday, yesterday_result)
+        # Assert - Yesterday goes to database, NOT Redis
+        redis_yesterday = await self.redis_cache.get_daily_summary(self.physics_guild_id, yesterday)
+        self.assertIsNone(redis_yesterday)
+        stored_yesterday = await self.test_store.get_daily_summaries(self.physics_guild_id, yesterday)
+        self.assertEqual(stored_yesterday, yesterday_result)
 
     async def test_context_merge_content_based_hashing(self):
         """Test that context merge uses content hashes as cache keys."""
@@ -790,14 +737,13 @@ class TestMemoryManagerCacheArchitecture(unittest.IsolatedAsyncioTestCase):
         facts = "Facts"
         current_day = "Current Day"
         historical = "Historical"
-        user_id = self.physicist_ids["Einstein"]
+        user_id = self.einstein_id
         self.mock_merge_client.generate_content.return_value = MemoryContext(context="Merged Context")
 
         # Act
-        daily_summaries = {
-            datetime.now(timezone.utc).date(): current_day,
-            datetime.now(timezone.utc).date() - timedelta(days=1): historical,
-        }
+        today = datetime.now(timezone.utc).date()
+        yesterday = today - timedelta(days=1)
+        daily_summaries = {today: current_day, yesterday: historical}
         await self.memory_manager._merge_context(self.physics_guild_id, user_id, facts, daily_summaries)
         await self.memory_manager._merge_context(self.physics_guild_id, user_id, facts, daily_summaries)
 
@@ -805,27 +751,10 @@ class TestMemoryManagerCacheArchitecture(unittest.IsolatedAsyncioTestCase):
         self.mock_merge_client.generate_content.assert_called_once()
 
 
-class TestMemoryManagerSmartFallback(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerSmartFallback(_MemoryManagerTestBase):
     """Test the smart fallback logic of the MemoryManager."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-        self.user_resolver = TestUserResolver()
-        self.mock_store = Mock(spec=Store)
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.mock_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
-        )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+    use_test_store = False
 
     async def test_single_source_memory_skips_ai_merge(self):
         """Test that when only one memory source exists, AI merge is skipped."""
@@ -864,62 +793,58 @@ class TestMemoryManagerSmartFallback(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(result3)
 
 
-class TestMemoryManagerConcurrency(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerConcurrency(_MemoryManagerTestBase):
     """Test concurrent processing validation for MemoryManager."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.all_dates = tuple(date(1905, 3, 6) - timedelta(days=i) for i in range(7))
 
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
+        # Read-only summaries-by-date input: a single day with a summary for each merged user
+        cls.daily_summaries_by_date = MappingProxyType(
+            {cls.all_dates[1]: {cls.physicist_ids[name]: "Summary" for name in ("Einstein", "Bohr", "Planck")}}
         )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
-        self.all_dates = [date(1905, 3, 6) - timedelta(days=i) for i in range(7)]
 
     async def test_fetch_all_daily_summaries_uses_asyncio_gather(self):
         """Test that daily summaries are fetched concurrently, not sequentially."""
 
-        # Arrange
-        async def slow_daily_summary(*args, **kwargs):
-            await asyncio.sleep(0.1)
+        # Arrange - every date must be in flight at once for the barrier to release
+        barrier = asyncio.Barrier(len(self.all_dates))
+        calls = 0
+
+        # Plain coroutine rather than a Mock side effect: only the count matters, not recorded args
+        async def daily_summary_probe(guild_id, for_date):
+            nonlocal calls
+            calls += 1
+            await barrier.wait()
             return {}
 
-        with patch.object(self.memory_manager, "_daily_summary", side_effect=slow_daily_summary) as mock_daily_summary:
-            start_time = asyncio.get_event_loop().time()
-            # Act
-            await self.memory_manager._fetch_all_daily_summaries(self.physics_guild_id, self.all_dates)
-            end_time = asyncio.get_event_loop().time()
+        with patch.object(self.memory_manager, "_daily_summary", new=daily_summary_probe):
+            # Act - A sequential fetch would block on the barrier and trip the timeout
+            await asyncio.wait_for(
+                self.memory_manager._fetch_all_daily_summaries(self.physics_guild_id, self.all_dates), timeout=1.0
+            )
 
             # Assert
-            self.assertEqual(mock_daily_summary.call_count, len(self.all_dates))
-            # If sequential, it would take at least 0.7s. Concurrent should be much faster.
-            self.assertLess(end_time - start_time, 0.5)
+            self.assertEqual(calls, len(self.all_dates))
 
     async def test_get_memories_merges_users_concurrently(self):
         """Test that multiple users' memories are merged concurrently within the timeout."""
         # Arrange
         user_ids = [self.physicist_ids["Einstein"], self.physicist_ids["Bohr"], self.physicist_ids["Planck"]]
-        daily_summaries_by_date = {self.all_dates[1]: {uid: "Summary" for uid in user_ids}}
 
         # Mock facts for all users
         self.test_store.get_user_facts = AsyncMock(side_effect=lambda guild_id, user_id: f"Facts for {user_id}")
 
-        async def slow_merge_context(*args, **kwargs):
-            await asyncio.sleep(0.1)
+        # Every user's merge must be in flight at once for the barrier to release
+        barrier = asyncio.Barrier(len(user_ids))
+        calls = 0
+
+        async def merge_context_probe(guild_id, user_id, facts, daily_summaries):
+            nonlocal calls
+            calls += 1
+            await barrier.wait()
             return "Merged context"
 
         with (
@@ -927,68 +852,43 @@ class TestMemoryManagerConcurrency(unittest.IsolatedAsyncioTestCase):
                 self.memory_manager,
                 "_fetch_all_daily_summaries",
                 new_callable=AsyncMock,
-                return_value=daily_summaries_by_date,
+                return_value=self.daily_summaries_by_date,
             ),
-            patch.object(self.memory_manager, "_merge_context", side_effect=slow_merge_context) as mock_merge,
+            patch.object(self.memory_manager, "_merge_context", new=merge_context_probe),
         ):
-            start_time = asyncio.get_event_loop().time()
             # Act
-            await self.memory_manager.get_memories(self.physics_guild_id, user_ids)
-            end_time = asyncio.get_event_loop().time()
+            results = await self.memory_manager.get_memories(self.physics_guild_id, user_ids)
 
-            # Assert
-            self.assertEqual(mock_merge.call_count, len(user_ids))
-            # If sequential, it would take at least 0.3s. Concurrent should be much faster.
-            self.assertLess(end_time - start_time, 0.2)
+            # Assert - Sequential merges would block on the barrier and hit the facts timeout fallback
+            self.assertEqual(calls, len(user_ids))
+            self.assertEqual(results, {uid: "Merged context" for uid in user_ids})
 
 
-class TestMemoryManagerDatabaseConcurrency(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerDatabaseConcurrency(_MemoryManagerTestBase):
     """Test database operations are properly concurrent."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
-        )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
-
     async def test_user_memory_creation_concurrent(self):
         """Test that user memory creation (merge operations) are processed concurrently."""
         # Arrange
         user_ids = [self.physicist_ids["Einstein"], self.physicist_ids["Bohr"], self.physicist_ids["Planck"]]
 
-        async def slow_create_user_memory(guild_id, user_id, facts, daily_summaries):
-            await asyncio.sleep(0.1)  # Simulate AI processing time
+        # Every user's memory creation must be in flight at once for the barrier to release
+        barrier = asyncio.Barrier(len(user_ids))
+
+        async def create_user_memory_probe(guild_id, user_id, facts, daily_summaries):
+            await barrier.wait()
             return f"Memory for {user_id}"
 
         with (
             patch.object(self.memory_manager, "_fetch_all_daily_summaries", new_callable=AsyncMock, return_value={}),
-            patch.object(self.memory_manager, "_create_user_memory", side_effect=slow_create_user_memory),
+            patch.object(self.memory_manager, "_create_user_memory", side_effect=create_user_memory_probe),
         ):
-            start_time = asyncio.get_event_loop().time()
             # Act
-            await self.memory_manager.get_memories(self.physics_guild_id, user_ids)
-            end_time = asyncio.get_event_loop().time()
+            results = await self.memory_manager.get_memories(self.physics_guild_id, user_ids)
 
-            # Assert - The _create_user_memory calls should happen concurrently
-            # If sequential, would take ~0.3s (3 * 0.1s). Concurrent should be ~0.1s.
-            # Allow some overhead for test execution, but should be much closer to 0.1s than 0.3s
-            self.assertLess(end_time - start_time, 0.2)  # Should be closer to 0.1s than 0.3s
+            # Assert - The _create_user_memory calls happen concurrently; sequential calls would
+            # block on the barrier and fall back to stored facts after the timeout
+            self.assertEqual(results, {uid: f"Memory for {uid}" for uid in user_ids})
 
     async def test_complex_mixed_failure_scenario(self):
         """Test realistic scenario where per-member builds return different fallback tiers."""
@@ -1014,66 +914,48 @@ class TestMemoryManagerDatabaseConcurrency(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(results[self.physicist_ids["Planck"]], "Planck historical")
 
 
-class TestMemoryManagerCacheEffectiveness(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerCacheEffectiveness(_MemoryManagerTestBase):
     """Test that caches actually prevent redundant AI calls."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-        self.redis_cache = NullRedisCache()
-
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=self.redis_cache,
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Every test here only counts AI calls, so one canned response per client is enough
+        cls.summary_response = DailySummaries(
+            summaries=[
+                UserSummary(
+                    user_id=cls.einstein_id,
+                    summary="Einstein discussed photoelectric effect and quantum theory",
+                )
+            ]
         )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+        cls.merge_response = MemoryContext(context="Merged context")
+
+    def setUp(self):
+        super().setUp()
+        self.mock_summary_client.generate_content.return_value = self.summary_response
+        self.mock_merge_client.generate_content.return_value = self.merge_response
 
     async def test_daily_summary_cache_prevents_redundant_ai_calls(self):
         """Test that repeated daily summary requests hit Redis cache instead of making AI calls."""
         test_date = date(1905, 3, 3)
 
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[
-                    UserSummary(
-                        user_id=self.physicist_ids["Einstein"],
-                        summary="Einstein discussed photoelectric effect and quantum theory",
-                    )
-                ]
-            )
-        )
-
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        # First call builds the summary synchronously and caches it to Redis
+        clock = self._freeze_clock(datetime(1905, 3, 3, 11, 0, tzinfo=timezone.utc))
+        await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
+        self.mock_summary_client.generate_content.assert_called_once()
 
-            # First call builds the summary synchronously and caches it to Redis
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 11, 0, tzinfo=timezone.utc)
-            await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
-            self.mock_summary_client.generate_content.assert_called_once()
-
-            # Reset mock to track subsequent calls
-            self.mock_summary_client.generate_content.reset_mock()
+        # Reset mock to track subsequent calls
+        self.mock_summary_client.generate_content.reset_mock()
 
-            # Act - Multiple calls within fresh window, all should hit cache
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 11, 30, tzinfo=timezone.utc)
-            await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
-            await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
-            await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
+        # Act - Multiple calls within fresh window, all should hit cache
+        clock.current = datetime(1905, 3, 3, 11, 30, tzinfo=timezone.utc)
+        await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
+        await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
+        await self.memory_manager._daily_summary(self.physics_guild_id, test_date)
 
-            # Assert - No AI calls after initial rebuild
-            self.mock_summary_client.generate_content.assert_not_called()
+        # Assert - No AI calls after initial rebuild
+        self.mock_summary_client.generate_content.assert_not_called()
 
     async def test_context_merge_cache_prevents_redundant_ai_calls(self):
         """Test that identical context merge requests hit cache."""
@@ -1081,70 +963,54 @@ class TestMemoryManagerCacheEffectiveness(unittest.IsolatedAsyncioTestCase):
         facts = "Test facts"
         current_day = "Current day summary"
         historical = "Historical summary"
-        user_id = self.physicist_ids["Einstein"]
-
-        self.mock_merge_client.generate_content = AsyncMock(return_value=MemoryContext(context="Merged context"))
+        user_id = self.einstein_id
 
         # Act - Make multiple identical merge requests
-        daily_summaries = {
-            datetime.now(timezone.utc).date(): current_day,
-            datetime.now(timezone.utc).date() - timedelta(days=1): historical,
-        }
-        await self.memory_manager._merge_context(self.physics_guild_id, user_id, facts, daily_summaries)
-        await self.memory_manager._merge_context(self.physics_guild_id, user_id, facts, daily_summaries)
-        await self.memory_manager._merge_context(self.physics_guild_id, user_id, facts, daily_summaries)
+        today = datetime.now(timezone.utc).date()
+        yesterday = today - timedelta(days=1)
+        daily_summaries = {today: current_day, yesterday: historical}
+        # Sequential on purpose: _merge_context doesn't coalesce, so concurrent misses would each call the AI
+        for attempt in range(3):
+            with self.subTest(attempt=attempt):
+                await self.memory_manager._merge_context(self.physics_guild_id, user_id, facts, daily_summaries)
 
-        # Assert - Should only make one AI call due to content-based caching
-        self.mock_merge_client.generate_content.assert_called_once()
+                # Assert - Should only make one AI call due to content-based caching
+                self.mock_merge_client.generate_content.assert_called_once()
 
     async def test_cache_invalidation_on_content_change(self):
         """Test that cache properly invalidates when content changes."""
         # Arrange
-        user_id = self.physicist_ids["Einstein"]
+        user_id = self.einstein_id
         original_facts = "Original facts"
         updated_facts = "Updated facts"
         current_day = "Current day summary"
         historical = "Historical summary"
 
-        self.mock_merge_client.generate_content = AsyncMock(return_value=MemoryContext(context="Merged context"))
+        today = datetime.now(timezone.utc).date()
+        yesterday = today - timedelta(days=1)
+        daily_summaries = {today: current_day, yesterday: historical}
+        updated_summaries = {today: "Updated current day summary", yesterday: historical}
+        changes = [
+            ("original", original_facts, daily_summaries),
+            ("facts changed", updated_facts, daily_summaries),
+            ("summaries changed", updated_facts, updated_summaries),
+        ]
 
-        # Act - Make calls with different content
-        daily_summaries = {
-            datetime.now(timezone.utc).date(): current_day,
-            datetime.now(timezone.utc).date() - timedelta(days=1): historical,
-        }
-        await self.memory_manager._merge_context(self.physics_guild_id, user_id, original_facts, daily_summaries)
-        await self.memory_manager._merge_context(self.physics_guild_id, user_id, updated_facts, daily_summaries)
+        # Act - Each call changes one input, so each must miss the cache
+        for expected_calls, (change, facts, summaries) in enumerate(changes, start=1):
+            with self.subTest(change=change):
+                await self.memory_manager._merge_context(self.physics_guild_id, user_id, facts, summaries)
 
-        # Assert - Should make two AI calls since content changed
-        self.assertEqual(self.mock_merge_client.generate_content.call_count, 2)
+                # Assert - One more AI call per content change
+                self.assertEqual(self.mock_merge_client.generate_content.call_count, expected_calls)
 
 
-class TestMemoryManagerDateBoundaries(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerDateBoundaries(_MemoryManagerTestBase):
     """Test edge cases around date boundaries and timezone handling."""
 
     def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic data and interactions
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-        self.redis_cache = NullRedisCache()
-
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=self.redis_cache,
-        )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+        super().setUp()
+        self.clock = self._freeze_clock()
 
     async def test_date_transition_cache_behavior(self):
         """Test cache behavior when date transitions from current to historical."""
@@ -1153,42 +1019,37 @@ class TestMemoryManagerDateBoundaries(unittest.IsolatedAsyncioTestCase):
         einstein_id = self.physicist_ids["Einstein"]
         expected_summaries = {einstein_id: "Einstein discussed relativity and mass-energy equivalence"}
 
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[
-                    UserSummary(
-                        user_id=einstein_id,
-                        summary="Einstein discussed relativity and mass-energy equivalence",
-                    )
-                ]
-            )
+        self.mock_summary_client.generate_content.return_value = DailySummaries(
+            summaries=[
+                UserSummary(
+                    user_id=einstein_id,
+                    summary="Einstein discussed relativity and mass-energy equivalence",
+                )
+            ]
         )
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            # First call when date is "current" — cold miss builds synchronously and caches to Redis
-            mock_datetime.now.return_value = datetime(1905, 3, 4, 23, 59, tzinfo=timezone.utc)
-            result1 = await self.memory_manager._daily_summary(self.physics_guild_id, transition_date)
-            self.assertEqual(result1, expected_summaries)
+        # First call when date is "current" — cold miss builds synchronously and caches to Redis
+        self.clock.current = datetime(1905, 3, 4, 23, 59, tzinfo=timezone.utc)
+        result1 = await self.memory_manager._daily_summary(self.physics_guild_id, transition_date)
+        self.assertEqual(result1, expected_summaries)
 
-            redis_data = await self.redis_cache.get_daily_summary(self.physics_guild_id, transition_date)
-            self.assertIsNotNone(redis_data)
-            self.assertEqual(redis_data[0], expected_summaries)
+        redis_data = await self.redis_cache.get_daily_summary(self.physics_guild_id, transition_date)
+        self.assertIsNotNone(redis_data)
+        self.assertEqual(redis_data[0], expected_summaries)
 
-            self.mock_summary_client.generate_content.reset_mock()
+        self.mock_summary_client.generate_content.reset_mock()
 
-            # Second call after midnight — date is now "historical", goes through DB path
-            mock_datetime.now.return_value = datetime(1905, 3, 5, 0, 1, tzinfo=timezone.utc)
-            result2 = await self.memory_manager._daily_summary(self.physics_guild_id, transition_date)
-            self.assertEqual(result2, expected_summaries)
+        # Second call after midnight — date is now "historical", goes through DB path
+        self.clock.current = datetime(1905, 3, 5, 0, 1, tzinfo=timezone.utc)
+        result2 = await self.memory_manager._daily_summary(self.physics_guild_id, transition_date)
+        self.assertEqual(result2, expected_summaries)
 
-            # Historical path makes exactly one AI call for this date
-            self.mock_summary_client.generate_content.assert_called_once()
+        # Historical path makes exactly one AI call for this date
+        self.mock_summary_client.generate_content.assert_called_once()
 
-            # Verify data persisted to DB via historical path
-            db_data = await self.test_store.get_daily_summaries(self.physics_guild_id, transition_date)
-            self.assertEqual(db_data, expected_summaries)
+        # Verify data persisted to DB via historical path
+        db_data = await self.test_store.get_daily_summaries(self.physics_guild_id, transition_date)
+        self.assertEqual(db_data, expected_summaries)
 
     async def test_empty_date_range_handling(self):
         """Test behavior with empty or invalid date ranges."""
@@ -1197,7 +1058,7 @@ class TestMemoryManagerDateBoundaries(unittest.IsolatedAsyncioTestCase):
 
         # Act & Assert - Should handle empty date list gracefully
         result = await self.memory_manager._fetch_all_daily_summaries(self.physics_guild_id, empty_dates)
-        self.assertEqual(result, {})
+        self.assertFalse(result)
         self.mock_summary_client.generate_content.assert_not_called()
 
     async def test_future_date_handling(self):
@@ -1205,47 +1066,30 @@ class TestMemoryManagerDateBoundaries(unittest.IsolatedAsyncioTestCase):
         # Arrange
         future_date = date(2025, 12, 31)
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self.clock.current = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
 
-            # Act
-            result = await self.memory_manager._daily_summary(self.physics_guild_id, future_date)
+        # Act
+        result = await self.memory_manager._daily_summary(self.physics_guild_id, future_date)
 
-            # Assert - Should handle future dates gracefully (no messages = empty summary)
-            self.assertEqual(result, {})
-            self.mock_summary_client.generate_content.assert_not_called()
+        # Assert - Should handle future dates gracefully (no messages = empty summary)
+        self.assertFalse(result)
+        self.mock_summary_client.generate_content.assert_not_called()
 
 
-class TestMemoryManagerDatabaseBacked(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerDatabaseBacked(_MemoryManagerTestBase):
     """Test database-backed daily summaries functionality."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-
-        # Use TestStore for realistic database simulation
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-
-        # Mock AI clients only
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-
-        # Component under test
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=NullRedisCache(),
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Responses are only read by MemoryManager, so tests share them
+        cls.photoelectric_response = DailySummaries(
+            summaries=[UserSummary(user_id=cls.einstein_id, summary="Einstein discussed photoelectric effect")]
         )
 
-        # Test data
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+    def setUp(self):
+        super().setUp()
+        self.clock = self._freeze_clock()
 
     async def test_historical_date_database_hit(self):
         """Test that historical dates use database and avoid LLM calls when summaries exist."""
@@ -1257,16 +1101,14 @@ class TestMemoryManagerDatabaseBacked(unittest.IsolatedAsyncioTestCase):
         # Pre-save summaries to TestStore to simulate existing database data
         await self.test_store.save_daily_summaries(self.physics_guild_id, physics_date, expected_summaries)
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 5, 12, 0, tzinfo=timezone.utc)  # Next day
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self.clock.current = datetime(1905, 3, 5, 12, 0, tzinfo=timezone.utc)  # Next day
 
-            # Act
-            result = await self.memory_manager._daily_summary(self.physics_guild_id, physics_date)
+        # Act
+        result = await self.memory_manager._daily_summary(self.physics_guild_id, physics_date)
 
-            # Assert
-            self.assertEqual(result, expected_summaries)
-            self.mock_summary_client.generate_content.assert_not_called()  # No LLM call needed
+        # Assert
+        self.assertEqual(result, expected_summaries)
+        self.mock_summary_client.generate_content.assert_not_called()  # No LLM call needed
 
     async def test_historical_date_database_miss_generates_and_saves(self):
         """Test that historical dates generate summaries and save to database when missing."""
@@ -1276,46 +1118,38 @@ class TestMemoryManagerDatabaseBacked(unittest.IsolatedAsyncioTestCase):
         generated_summaries = {einstein_id: "Einstein discussed photoelectric effect"}
 
         # Mock AI response for generating summaries
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed photoelectric effect")]
-            )
-        )
+        self.mock_summary_client.generate_content.return_value = self.photoelectric_response
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 4, 12, 0, tzinfo=timezone.utc)  # Next day
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self.clock.current = datetime(1905, 3, 4, 12, 0, tzinfo=timezone.utc)  # Next day
 
-            # Act
-            result = await self.memory_manager._daily_summary(self.physics_guild_id, physics_discussion_date)
+        # Act
+        result = await self.memory_manager._daily_summary(self.physics_guild_id, physics_discussion_date)
 
-            # Assert
-            self.assertEqual(result, generated_summaries)
-            self.mock_summary_client.generate_content.assert_called_once()  # LLM call made
+        # Assert
+        self.assertEqual(result, generated_summaries)
+        self.mock_summary_client.generate_content.assert_called_once()  # LLM call made
 
-            # Verify summaries were saved to TestStore and can be retrieved
-            saved_summaries = await self.test_store.get_daily_summaries(self.physics_guild_id, physics_discussion_date)
-            self.assertEqual(saved_summaries, generated_summaries)
+        # Verify summaries were saved to TestStore and can be retrieved
+        saved_summaries = await self.test_store.get_daily_summaries(self.physics_guild_id, physics_discussion_date)
+        self.assertEqual(saved_summaries, generated_summaries)
 
     async def test_historical_date_no_messages_skips_database_and_llm(self):
         """Test that historical dates with no messages return empty without DB or LLM calls."""
         # Arrange - Use March 2nd which has no messages in TestStore
         historical_date = date(1905, 3, 2)  # Date with no physics discussions
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self.clock.current = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
 
-            # Act
-            result = await self.memory_manager._daily_summary(self.physics_guild_id, historical_date)
+        # Act
+        result = await self.memory_manager._daily_summary(self.physics_guild_id, historical_date)
 
-            # Assert
-            self.assertEqual(result, {})
-            self.mock_summary_client.generate_content.assert_not_called()  # Skip LLM
+        # Assert
+        self.assertFalse(result)
+        self.mock_summary_client.generate_content.assert_not_called()  # Skip LLM
 
-            # Verify TestStore correctly reports no messages for this date
-            has_messages = await self.test_store.has_chat_messages_for_date(self.physics_guild_id, historical_date)
-            self.assertFalse(has_messages)
+        # Verify TestStore correctly reports no messages for this date
+        has_messages = await self.test_store.has_chat_messages_for_date(self.physics_guild_id, historical_date)
+        self.assertFalse(has_messages)
 
     async def test_current_day_cold_miss_builds_synchronously(self):
         """Test that a current-day cache miss builds synchronously (never {}) and caches to Redis."""
@@ -1325,25 +1159,19 @@ class TestMemoryManagerDatabaseBacked(unittest.IsolatedAsyncioTestCase):
         generated = {einstein_id: "Einstein discussed photoelectric effect"}
 
         # Mock AI response for generating summaries
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed photoelectric effect")]
-            )
-        )
+        self.mock_summary_client.generate_content.return_value = self.photoelectric_response
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self.clock.current = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
 
-            # Act - Cold miss builds synchronously instead of returning empty
-            result = await self.memory_manager._daily_summary(self.physics_guild_id, today)
+        # Act - Cold miss builds synchronously instead of returning empty
+        result = await self.memory_manager._daily_summary(self.physics_guild_id, today)
 
-            # Assert - Real summaries returned and persisted to Redis with a timestamp
-            self.assertEqual(result, generated)
-            self.mock_summary_client.generate_content.assert_called_once()
-            cached = await self.memory_manager._redis_cache.get_daily_summary(self.physics_guild_id, today)
-            self.assertIsNotNone(cached)
-            self.assertEqual(cached[0], generated)
+        # Assert - Real summaries returned and persisted to Redis with a timestamp
+        self.assertEqual(result, generated)
+        self.mock_summary_client.generate_content.assert_called_once()
+        cached = await self.memory_manager._redis_cache.get_daily_summary(self.physics_guild_id, today)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached[0], generated)
 
     async def test_database_persistence_integration(self):
         """Test that summaries are properly saved and retrieved from database via Store."""
@@ -1353,163 +1181,140 @@ class TestMemoryManagerDatabaseBacked(unittest.IsolatedAsyncioTestCase):
         generated_summaries = {einstein_id: "Einstein discussed photoelectric effect"}
 
         # Mock AI response for generating summaries
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed photoelectric effect")]
-            )
-        )
+        self.mock_summary_client.generate_content.return_value = self.photoelectric_response
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 4, 12, 0, tzinfo=timezone.utc)  # Next day
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self.clock.current = datetime(1905, 3, 4, 12, 0, tzinfo=timezone.utc)  # Next day
 
-            # Act - First call should generate and save summaries
-            result1 = await self.memory_manager._daily_summary(self.physics_guild_id, physics_date)
+        # Act - First call should generate and save summaries
+        result1 = await self.memory_manager._daily_summary(self.physics_guild_id, physics_date)
 
-            # Second call should retrieve from database (no additional AI call)
-            result2 = await self.memory_manager._daily_summary(self.physics_guild_id, physics_date)
+        # Second call should retrieve from database (no additional AI call)
+        result2 = await self.memory_manager._daily_summary(self.physics_guild_id, physics_date)
 
-            # Assert
-            self.assertEqual(result1, generated_summaries)
-            self.assertEqual(result2, generated_summaries)
-            self.mock_summary_client.generate_content.assert_called_once()  # Only one AI call
+        # Assert
+        self.assertEqual(result1, generated_summaries)
+        self.assertEqual(result2, generated_summaries)
+        self.mock_summary_client.generate_content.assert_called_once()  # Only one AI call
 
-            # Verify persistence integration - summaries stored and retrievable
-            stored_summaries = await self.test_store.get_daily_summaries(self.physics_guild_id, physics_date)
-            self.assertEqual(stored_summaries, generated_summaries)
+        # Verify persistence integration - summaries stored and retrievable
+        stored_summaries = await self.test_store.get_daily_summaries(self.physics_guild_id, physics_date)
+        self.assertEqual(stored_summaries, generated_summaries)
 
 
-class TestMemoryManagerCurrentDayBuild(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerCurrentDayBuild(_MemoryManagerTestBase):
     """Current-day summary: fresh reuse, synchronous rebuild on staleness/miss, coalescing."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Responses are only read by MemoryManager, so tests share them
+        cls.fresh_response = DailySummaries(summaries=[UserSummary(user_id=cls.einstein_id, summary="Fresh summary")])
+        cls.built_once_response = DailySummaries(summaries=[UserSummary(user_id=cls.einstein_id, summary="Built once")])
+
     def setUp(self):
-        self.telemetry = NullTelemetry()
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-        self.redis_cache = NullRedisCache()
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=self.redis_cache,
-        )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+        super().setUp()
         self.today = date(1905, 3, 3)
-        self.einstein_id = self.physicist_ids["Einstein"]
-
-    def _make_summaries_response(self, summaries: dict[int, str]) -> DailySummaries:
-        return DailySummaries(summaries=[UserSummary(user_id=uid, summary=text) for uid, text in summaries.items()])
+        self.clock = self._freeze_clock()
 
     async def test_fresh_cache_returns_immediately_no_rebuild(self):
         """A current-day entry fresher than the staleness threshold is reused without an AI call."""
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            # Seed Redis with a value created 30 minutes ago (fresh)
-            await self.redis_cache.set_daily_summary(
-                self.physics_guild_id,
-                self.today,
-                {self.einstein_id: "Einstein discussed photoelectric effect"},
-                datetime(1905, 3, 3, 10, 0, tzinfo=timezone.utc),
-            )
+        # Seed Redis with a value created 30 minutes ago (fresh)
+        await self.redis_cache.set_daily_summary(
+            self.physics_guild_id,
+            self.today,
+            {self.einstein_id: "Einstein discussed photoelectric effect"},
+            datetime(1905, 3, 3, 10, 0, tzinfo=timezone.utc),
+        )
 
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 10, 30, tzinfo=timezone.utc)
-            result = await self.memory_manager._daily_summary(self.physics_guild_id, self.today)
+        self.clock.current = datetime(1905, 3, 3, 10, 30, tzinfo=timezone.utc)
+        result = await self.memory_manager._daily_summary(self.physics_guild_id, self.today)
 
-            self.assertEqual(result, {self.einstein_id: "Einstein discussed photoelectric effect"})
-            self.mock_summary_client.generate_content.assert_not_called()
+        self.assertEqual(result, {self.einstein_id: "Einstein discussed photoelectric effect"})
+        self.mock_summary_client.generate_content.assert_not_called()
 
     async def test_stale_cache_rebuilds_synchronously(self):
         """A current-day entry past the staleness threshold is rebuilt synchronously and returned fresh."""
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            # Seed Redis with a value created 90 minutes ago (stale)
-            await self.redis_cache.set_daily_summary(
-                self.physics_guild_id,
-                self.today,
-                {self.einstein_id: "Stale summary"},
-                datetime(1905, 3, 3, 9, 0, tzinfo=timezone.utc),
-            )
-            self.mock_summary_client.generate_content = AsyncMock(
-                return_value=self._make_summaries_response({self.einstein_id: "Fresh summary"})
-            )
+        # Seed Redis with a value created 90 minutes ago (stale)
+        await self.redis_cache.set_daily_summary(
+            self.physics_guild_id,
+            self.today,
+            {self.einstein_id: "Stale summary"},
+            datetime(1905, 3, 3, 9, 0, tzinfo=timezone.utc),
+        )
+        self.mock_summary_client.generate_content.return_value = self.fresh_response
 
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 10, 30, tzinfo=timezone.utc)
-            result = await self.memory_manager._daily_summary(self.physics_guild_id, self.today)
+        self.clock.current = datetime(1905, 3, 3, 10, 30, tzinfo=timezone.utc)
+        result = await self.memory_manager._daily_summary(self.physics_guild_id, self.today)
 
-            # Synchronous rebuild returns fresh data in the same call (no stale serve)
-            self.assertEqual(result, {self.einstein_id: "Fresh summary"})
-            self.mock_summary_client.generate_content.assert_called_once()
+        # Synchronous rebuild returns fresh data in the same call (no stale serve)
+        self.assertEqual(result, {self.einstein_id: "Fresh summary"})
+        self.mock_summary_client.generate_content.assert_called_once()
 
     async def test_concurrent_misses_coalesce_to_single_build(self):
         """Concurrent current-day misses share one build (await-not-skip), not N rebuilds."""
+        build_started = asyncio.Event()
+        release_build = asyncio.Event()
 
-        async def slow_generate(*args, **kwargs):
-            await asyncio.sleep(0.1)
-            return self._make_summaries_response({self.einstein_id: "Built once"})
+        # The build is held open until every caller has queued behind it
+        async def gated_generate(*args, **kwargs):
+            build_started.set()
+            await release_build.wait()
+            return self.built_once_response
 
-        self.mock_summary_client.generate_content = AsyncMock(side_effect=slow_generate)
+        self.mock_summary_client.generate_content.side_effect = gated_generate
 
-        with patch("memory_manager.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+        self.clock.current = datetime(1905, 3, 3, 12, 0, tzinfo=timezone.utc)
 
-            results = await asyncio.gather(
-                self.memory_manager._daily_summary(self.physics_guild_id, self.today),
-                self.memory_manager._daily_summary(self.physics_guild_id, self.today),
-                self.memory_manager._daily_summary(self.physics_guild_id, self.today),
-            )
+        pending = asyncio.gather(
+            self.memory_manager._daily_summary(self.physics_guild_id, self.today),
+            self.memory_manager._daily_summary(self.physics_guild_id, self.today),
+            self.memory_manager._daily_summary(self.physics_guild_id, self.today),
+        )
+        await build_started.wait()
+        release_build.set()
+        results = await pending
 
         for result in results:
             self.assertEqual(result, {self.einstein_id: "Built once"})
         self.assertEqual(self.mock_summary_client.generate_content.call_count, 1)
 
+    async def test_concurrent_reads_share_single_redis_get(self):
+        """Concurrent reads of a fresh current-day entry share one Redis GET."""
+        await self.redis_cache.set_daily_summary(
+            self.physics_guild_id,
+            self.today,
+            {self.einstein_id: "Einstein discussed photoelectric effect"},
+            datetime(1905, 3, 3, 10, 0, tzinfo=timezone.utc),
+        )
+        self.clock.current = datetime(1905, 3, 3, 10, 30, tzinfo=timezone.utc)
 
-class TestMemoryManagerBudgetAndCoalescing(unittest.IsolatedAsyncioTestCase):
-    """Outer timeout fallback to memory_latest/facts, member coalescing, and both-key writes."""
+        with patch.object(
+            self.redis_cache, "get_daily_summary", wraps=self.redis_cache.get_daily_summary
+        ) as get_daily_summary:
+            results = await asyncio.gather(
+                *[self.memory_manager._daily_summary(self.physics_guild_id, self.today) for _ in range(3)]
+            )
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-        self.user_resolver = TestUserResolver()
-        self.mock_store = Mock(spec=Store)
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.redis_cache = NullRedisCache()
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
-        self.einstein_id = self.physicist_ids["Einstein"]
+        for result in results:
+            self.assertEqual(result, {self.einstein_id: "Einstein discussed photoelectric effect"})
+        get_daily_summary.assert_awaited_once()
+        self.mock_summary_client.generate_content.assert_not_called()
 
-    def _manager(self, timeout: float | None) -> MemoryManager:
-        return MemoryManager(
-            telemetry=self.telemetry,
-            store=self.mock_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=self.redis_cache,
-            timeout=timeout,
-        )
+
+class TestMemoryManagerBudgetAndCoalescing(_MemoryManagerTestBase):
+    """Outer timeout fallback to memory_latest/facts, member coalescing, and both-key writes."""
+
+    use_test_store = False
 
     async def test_timeout_serves_memory_latest(self):
         """When a member build exceeds the timeout, the last-known-good memory_latest is served."""
         manager = self._manager(timeout=0.05)
         await self.redis_cache.set_memory(self.physics_guild_id, self.einstein_id, "fh", "sh", "previous merged memory")
 
-        async def slow_build(guild_id, user_id):
-            await asyncio.sleep(0.3)
-            return "fresh merged memory"
+        async def stuck_build(guild_id, user_id):
+            await asyncio.Event().wait()  # never completes, so the timeout always wins
 
-        with patch.object(manager, "_build_member_memory", side_effect=slow_build):
+        with patch.object(manager, "_build_member_memory", side_effect=stuck_build):
             result = await manager.get_memory(self.physics_guild_id, self.einstein_id)
 
         self.assertEqual(result, "previous merged memory")
@@ -1519,11 +1324,10 @@ class TestMemoryManagerBudgetAndCoalescing(unittest.IsolatedAsyncioTestCase):
         manager = self._manager(timeout=0.05)
         self.mock_store.get_user_facts = AsyncMock(return_value="raw facts")
 
-        async def slow_build(guild_id, user_id):
-            await asyncio.sleep(0.3)
-            return "fresh merged memory"
+        async def stuck_build(guild_id, user_id):
+            await asyncio.Event().wait()  # never completes, so the timeout always wins
 
-        with patch.object(manager, "_build_member_memory", side_effect=slow_build):
+        with patch.object(manager, "_build_member_memory", side_effect=stuck_build):
             result = await manager.get_memory(self.physics_guild_id, self.einstein_id)
 
         self.assertEqual(result, "raw facts")
@@ -1532,17 +1336,20 @@ class TestMemoryManagerBudgetAndCoalescing(unittest.IsolatedAsyncioTestCase):
         """The build is shielded, so it keeps running after the caller bails and warms the cache."""
         manager = self._manager(timeout=0.05)
         self.mock_store.get_user_facts = AsyncMock(return_value=None)
+        release_build = asyncio.Event()
         completed = asyncio.Event()
 
-        async def slow_build(guild_id, user_id):
-            await asyncio.sleep(0.1)
+        # Held open until the caller has already given up on it
+        async def gated_build(guild_id, user_id):
+            await release_build.wait()
             await self.redis_cache.set_memory(guild_id, user_id, "fh", "sh", "warmed memory")
             completed.set()
             return "warmed memory"
 
-        with patch.object(manager, "_build_member_memory", side_effect=slow_build):
+        with patch.object(manager, "_build_member_memory", side_effect=gated_build):
             first = await manager.get_memory(self.physics_guild_id, self.einstein_id)
             self.assertIsNone(first)  # no latest and no facts -> None fallback
+            release_build.set()
             await asyncio.wait_for(completed.wait(), timeout=1.0)
 
         latest = await self.redis_cache.get_memory_latest(self.physics_guild_id, self.einstein_id)
@@ -1561,17 +1368,24 @@ class TestMemoryManagerBudgetAndCoalescing(unittest.IsolatedAsyncioTestCase):
     async def test_concurrent_member_reads_coalesce_to_single_build(self):
         """Concurrent reads for the same cold member share one build."""
         manager = self._manager(timeout=None)
+        build_started = asyncio.Event()
+        release_build = asyncio.Event()
 
-        async def slow_build(guild_id, user_id):
-            await asyncio.sleep(0.1)
+        # The build is held open until every reader has queued behind it
+        async def gated_build(guild_id, user_id):
+            build_started.set()
+            await release_build.wait()
             return "built"
 
-        with patch.object(manager, "_build_member_memory", side_effect=slow_build) as mock_build:
-            results = await asyncio.gather(
+        with patch.object(manager, "_build_member_memory", side_effect=gated_build) as mock_build:
+            pending = asyncio.gather(
                 manager.get_memory(self.physics_guild_id, self.einstein_id),
                 manager.get_memory(self.physics_guild_id, self.einstein_id),
                 manager.get_memory(self.physics_guild_id, self.einstein_id),
             )
+            await build_started.wait()
+            release_build.set()
+            results = await pending
 
         self.assertEqual(results, ["built", "built", "built"])
         self.assertEqual(mock_build.call_count, 1)
@@ -1579,7 +1393,7 @@ class TestMemoryManagerBudgetAndCoalescing(unittest.IsolatedAsyncioTestCase):
     async def test_merge_writes_both_keys_trivial_path_writes_neither(self):
         """A real merge populates both memory: and memory_latest:; trivial paths write neither."""
         manager = self._manager(timeout=None)
-        self.mock_merge_client.generate_content = AsyncMock(return_value=MemoryContext(context="merged"))
+        self.mock_merge_client.generate_content.return_value = MemoryContext(context="merged")
 
         # Multiple sources -> real LLM merge -> both keys written
         await manager._create_user_memory(
@@ -1601,17 +1415,19 @@ class TestMemoryManagerBudgetAndCoalescing(unittest.IsolatedAsyncioTestCase):
         manager = self._manager(timeout=1.0)
         registry: dict = {}
         started = 0
+        release = asyncio.Event()
 
         async def factory():
             nonlocal started
             started += 1
-            await asyncio.sleep(0.05)
+            await release.wait()
             return "value"
 
         # Two concurrent calls share a single in-flight task
         t1 = manager._coalesce(registry, ("k",), factory)
         t2 = manager._coalesce(registry, ("k",), factory)
         self.assertIs(t1, t2)
+        release.set()
         self.assertEqual(await t1, "value")
 
         # Once finished, a new call starts a fresh task instead of reusing the done one
@@ -1621,40 +1437,25 @@ class TestMemoryManagerBudgetAndCoalescing(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(started, 2)
 
 
-class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
+class TestMemoryManagerAliasExtraction(_MemoryManagerTestBase):
     """Test alias extraction from factual memory for identity resolution."""
 
-    def setUp(self):
-        self.telemetry = NullTelemetry()
-        self.test_store = TestStore()
-        self.user_resolver = self.test_store.user_resolver
-        self.redis_cache = NullRedisCache()
-        self.mock_summary_client = Mock(spec=AIClient)
-        self.mock_alias_client = Mock(spec=AIClient)
-        self.mock_merge_client = Mock(spec=AIClient)
-        self.memory_manager = MemoryManager(
-            telemetry=self.telemetry,
-            store=self.test_store,
-            summary_client=self.mock_summary_client,
-            alias_client=self.mock_alias_client,
-            merge_client=self.mock_merge_client,
-            user_resolver=self.user_resolver,
-            redis_cache=self.redis_cache,
-        )
-        self.physics_guild_id = self.user_resolver.physics_guild_id
-        self.physicist_ids = self.user_resolver.physicist_ids
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.albert_aliases = UserAliases(aliases=["Albert"])
 
     async def test_extract_aliases_returns_aliases_for_each_user(self):
-        """Test that aliases are extracted concurrently for all users with facts."""
+        """Test that aliases for all users with facts are extracted in a single batched request."""
         einstein_id = self.physicist_ids["Einstein"]
         bohr_id = self.physicist_ids["Bohr"]
 
-        async def gemma_side_effect(message, **kwargs):
-            if "Albert" in message:
-                return UserAliases(aliases=["Albert"])
-            return UserAliases(aliases=["Niels"])
-
-        self.mock_alias_client.generate_content = AsyncMock(side_effect=gemma_side_effect)
+        self.mock_alias_client.generate_content.return_value = BatchAliases(
+            members=[
+                MemberAliases(member_index=1, aliases=["Albert"]),
+                MemberAliases(member_index=2, aliases=["Niels"]),
+            ]
+        )
 
         user_facts = {
             einstein_id: "He is Albert, a theoretical physicist",
@@ -1664,14 +1465,77 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(result[einstein_id], ["Albert"])
         self.assertEqual(result[bohr_id], ["Niels"])
+        self.mock_alias_client.generate_content.assert_called_once()
+        call_kwargs = self.mock_alias_client.generate_content.call_args.kwargs
+        self.assertIs(call_kwargs["response_schema"], BatchAliases)
+        # Members are labelled by position rather than by their Discord ID
+        self.assertIn(
+            '<member index="1"><facts>He is Albert, a theoretical physicist</facts></member>', call_kwargs["message"]
+        )
+        self.assertIn(
+            '<member index="2"><facts>He is Niels, works on atomic structure</facts></member>', call_kwargs["message"]
+        )
+        self.assertNotIn(str(einstein_id), call_kwargs["message"])
+
+    async def test_extract_aliases_batches_only_cache_misses(self):
+        """Test that users with cached aliases are left out of the batched request."""
+        einstein_id, bohr_id, planck_id = (self.physicist_ids[name] for name in ("Einstein", "Bohr", "Planck"))
+        user_facts = {
+            einstein_id: "He is Albert",
+            bohr_id: "He is Niels",
+            planck_id: "He is Max",
+        }
+        await self.redis_cache.set_aliases(hashlib.md5(user_facts[einstein_id].encode()).hexdigest(), ["Albert"])
+
+        self.mock_alias_client.generate_content.return_value = BatchAliases(
+            members=[
+                MemberAliases(member_index=1, aliases=["Niels"]),
+                MemberAliases(member_index=2, aliases=["Max"]),
+            ]
+        )
+
+        result = await self.memory_manager._extract_aliases(user_facts)
+
+        self.assertEqual(result, {einstein_id: ["Albert"], bohr_id: ["Niels"], planck_id: ["Max"]})
+        message = self.mock_alias_client.generate_content.call_args.kwargs["message"]
+        self.assertNotIn(user_facts[einstein_id], message)
+
+        # Batch results are cached per user, so a later request with any mix of these users is a hit
+        self.mock_alias_client.generate_content.reset_mock()
+        await self.memory_manager._extract_aliases({bohr_id: "He is Niels", planck_id: "He is Max"})
+        self.mock_alias_client.generate_content.assert_not_called()
+
+    async def test_extract_aliases_retries_members_the_batch_omits(self):
+        """Test that out-of-range batch entries are dropped and omitted members are extracted individually."""
+        einstein_id, bohr_id = self.physicist_ids["Einstein"], self.physicist_ids["Bohr"]
+
+        async def extract(message, response_schema, **kwargs):
+            if response_schema is BatchAliases:
+                # Bohr (index 2) is left out, and index 3 matches no requested member
+                return BatchAliases(
+                    members=[
+                        MemberAliases(member_index=1, aliases=["Albert"]),
+                        MemberAliases(member_index=3, aliases=["Max"]),
+                    ]
+                )
+            return UserAliases(aliases=["Niels"])
+
+        self.mock_alias_client.generate_content.side_effect = extract
+
+        result = await self.memory_manager._extract_aliases({einstein_id: "He is Albert", bohr_id: "He is Niels"})
+
+        self.assertEqual(result, {einstein_id: ["Albert"], bohr_id: ["Niels"]})
         self.assertEqual(self.mock_alias_client.generate_content.call_count, 2)
+        self.assertEqual(self.mock_alias_client.generate_content.call_args.kwargs["message"], "He is Niels")
+        # The individually extracted member is cached like a batch result
+        self.assertEqual(await self.redis_cache.get_aliases(hashlib.md5(b"He is Niels").hexdigest()), ["Niels"])
 
     async def test_extract_aliases_caches_by_facts_hash(self):
         """Test that repeated extraction with same facts hits cache."""
         einstein_id = self.physicist_ids["Einstein"]
         facts = "He is Albert, a theoretical physicist"
 
-        self.mock_alias_client.generate_content = AsyncMock(return_value=UserAliases(aliases=["Albert"]))
+        self.mock_alias_client.generate_content.return_value = self.albert_aliases
 
         await self.memory_manager._extract_aliases({einstein_id: facts})
         await self.memory_manager._extract_aliases({einstein_id: facts})
@@ -1682,7 +1546,7 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
         """Test that different facts produce a cache miss."""
         einstein_id = self.physicist_ids["Einstein"]
 
-        self.mock_alias_client.generate_content = AsyncMock(return_value=UserAliases(aliases=["Albert"]))
+        self.mock_alias_client.generate_content.return_value = self.albert_aliases
 
         await self.memory_manager._extract_aliases({einstein_id: "He is Albert"})
         await self.memory_manager._extract_aliases({einstein_id: "He is Albert Einstein, also known as Al"})
@@ -1692,11 +1556,11 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
     async def test_extract_aliases_empty_input_returns_empty(self):
         """Test that empty user_facts returns empty dict."""
         result = await self.memory_manager._extract_aliases({})
-        self.assertEqual(result, {})
+        self.assertFalse(result)
         self.mock_alias_client.generate_content.assert_not_called()
 
     async def test_extract_aliases_partial_failure_returns_successful(self):
-        """Test that one user's extraction failure doesn't block others."""
+        """Test that a failed batch is retried per user, so one user's failure doesn't block others."""
         einstein_id = self.physicist_ids["Einstein"]
         bohr_id = self.physicist_ids["Bohr"]
 
@@ -1707,9 +1571,9 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
             call_count += 1
             if "fails" in message:
                 raise ValueError("AI service unavailable")
-            return UserAliases(aliases=["Albert"])
+            return self.albert_aliases
 
-        self.mock_alias_client.generate_content = AsyncMock(side_effect=gemma_side_effect)
+        self.mock_alias_client.generate_content.side_effect = gemma_side_effect
 
         user_facts = {
             einstein_id: "He is Albert",
@@ -1720,6 +1584,7 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
         self.assertIn(einstein_id, result)
         self.assertEqual(result[einstein_id], ["Albert"])
         self.assertNotIn(bohr_id, result)
+        self.assertEqual(call_count, 3)  # The failed batch, then one request per user
 
     async def test_daily_summaries_include_aliases_in_prompt(self):
         """Test that _create_daily_summaries injects aliases into the target_users XML."""
@@ -1730,13 +1595,11 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
         self.test_store._user_facts[einstein_id] = "He is Albert, a theoretical physicist"
 
         # Mock alias extraction
-        self.mock_alias_client.generate_content = AsyncMock(return_value=UserAliases(aliases=["Albert"]))
+        self.mock_alias_client.generate_content.return_value = self.albert_aliases
 
         # Mock daily summary generation
-        self.mock_summary_client.generate_content = AsyncMock(
-            return_value=DailySummaries(
-                summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed physics")]
-            )
+        self.mock_summary_client.generate_content.return_value = DailySummaries(
+            summaries=[UserSummary(user_id=einstein_id, summary="Einstein discussed physics")]
         )
 
         await self.memory_manager._create_daily_summaries(self.physics_guild_id, test_date)
@@ -1746,14 +1609,8 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
         prompt = gemini_call_args[1]["message"]
         self.assertIn("<also_known_as>Albert</also_known_as>", prompt)
 
-    async def test_extract_aliases_concurrent_processing(self):
-        """Test that alias extraction for multiple users happens concurrently."""
-
-        async def slow_extract(message, **kwargs):
-            await asyncio.sleep(0.1)
-            return UserAliases(aliases=["Name"])
-
-        self.mock_alias_client.generate_content = AsyncMock(side_effect=slow_extract)
+    async def test_extract_aliases_per_user_fallback_is_concurrent(self):
+        """Test that the per-user fallback after a failed batch extracts all users concurrently."""
 
         user_facts = {
             self.physicist_ids["Einstein"]: "Facts A",
@@ -1761,12 +1618,22 @@ class TestMemoryManagerAliasExtraction(unittest.IsolatedAsyncioTestCase):
             self.physicist_ids["Planck"]: "Facts C",
         }
 
-        start_time = asyncio.get_event_loop().time()
-        await self.memory_manager._extract_aliases(user_facts)
-        elapsed = asyncio.get_event_loop().time() - start_time
+        # Every user's extraction must be in flight at once for the barrier to release
+        barrier = asyncio.Barrier(len(user_facts))
+
+        async def concurrent_extract(message, response_schema, **kwargs):
+            if response_schema is BatchAliases:
+                raise ValueError("Structured output failed")
+            await barrier.wait()
+            return UserAliases(aliases=["Name"])
+
+        self.mock_alias_client.generate_content.side_effect = concurrent_extract
+
+        # A sequential fallback would block on the barrier and trip the timeout
+        result = await asyncio.wait_for(self.memory_manager._extract_aliases(user_facts), timeout=1.0)
 
-        self.assertEqual(self.mock_alias_client.generate_content.call_count, 3)
-        self.assertLess(elapsed, 0.2)
+        self.assertEqual(result, dict.fromkeys(user_facts, ["Name"]))
+        self.assertEqual(self.mock_alias_client.generate_content.call_count, 4)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""Unit tests for UserResolver display-name resolution and mention replacement."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from null_telemetry import NullTelemetry
+from user_resolver import FALLBACK_NAME_TTL_SECONDS, UserResolver
+
+
+class TestReplaceUserMentions(unittest.IsolatedAsyncioTestCase):
+    GUILD_ID = 123
+
+    @classmethod
+    def setUpClass(cls):
+        cls.telemetry = NullTelemetry()
+
+    def setUp(self):
+        self.user_resolver = UserResolver(self.telemetry)
+
+    async def test_replaces_both_mention_forms(self):
+        async def display_name(guild_id, user_id):
+            return {1: "Alice", 2: "Bob"}[user_id]
+
+        with patch.object(self.user_resolver, "get_display_name", side_effect=display_name) as get_display_name:
+            result = await self.user_resolver.replace_user_mentions_with_names(
+                "<@1> meet <@!2>, <@2> meet <@!1>", self.GUILD_ID
+            )
+
+        self.assertEqual(result, "Alice meet Bob, Bob meet Alice")
+        # Repeated mentions of a user resolve once
+        self.assertEqual(get_display_name.await_count, 2)
+
+    async def test_display_names_are_inserted_literally(self):
+        """Backslashes in a display name must not be read as regex replacement escapes."""
+
+        async def display_name(guild_id, user_id):
+            return r"\o/ \1"
+
+        with patch.object(self.user_resolver, "get_display_name", side_effect=display_name):
+            result = await self.user_resolver.replace_user_mentions_with_names("hi <@1>", self.GUILD_ID)
+
+        self.assertEqual(result, r"hi \o/ \1")
+
+    async def test_only_ascii_digit_mentions_are_replaced(self):
+        """Discord ids are ASCII digits; other Unicode digits must not be read as a mention."""
+
+        async def display_name(guild_id, user_id):
+            return "Alice"
+
+        with patch.object(self.user_resolver, "get_display_name", side_effect=display_name) as get_display_name:
+            result = await self.user_resolver.replace_user_mentions_with_names("<@١٢٣> <@123> <@!123>", self.GUILD_ID)
+
+        self.assertEqual(result, "<@١٢٣> Alice Alice")
+        get_display_name.assert_awaited_once_with(self.GUILD_ID, 123)
+
+    async def test_resolves_distinct_mentions_concurrently(self):
+        # Every lookup must be in flight at once for the barrier to release
+        barrier = asyncio.Barrier(3)
+
+        async def display_name_probe(guild_id, user_id):
+            await barrier.wait()
+            return f"User{user_id}"
+
+        with patch.object(self.user_resolver, "get_display_name", new=display_name_probe):
+            # A sequential resolution would block on the barrier and trip the timeout
+            result = await asyncio.wait_for(
+                self.user_resolver.replace_user_mentions_with_names("<@1> <@2> <@3>", self.GUILD_ID), timeout=1.0
+            )
+
+        self.assertEqual(result, "User1 User2 User3")
+
+    async def test_cached_names_skip_get_display_name(self):
+        self.user_resolver._display_name_cache[(self.GUILD_ID, 1)] = "Alice"
+
+        async def display_name(guild_id, user_id):
+            return "Bob"
+
+        with patch.object(self.user_resolver, "get_display_name", side_effect=display_name) as get_display_name:
+            result = await self.user_resolver.replace_user_mentions_with_names("<@1> and <@2>", self.GUILD_ID)
+
+        self.assertEqual(result, "Alice and Bob")
+        get_display_name.assert_awaited_once_with(self.GUILD_ID, 2)
+
+    async def test_text_without_mentions_is_unchanged(self):
+        with patch.object(self.user_resolver, "get_display_name") as get_display_name:
+            result = await self.user_resolver.replace_user_mentions_with_names("no mentions here", self.GUILD_ID)
+
+        self.assertEqual(result, "no mentions here")
+        get_display_name.assert_not_called()
+
+
+class TestGetDisplayName(unittest.IsolatedAsyncioTestCase):
+    GUILD_ID = 123
+    USER_ID = 7
+
+    @classmethod
+    def setUpClass(cls):
+        cls.telemetry = NullTelemetry()
+
+    def setUp(self):
+        self.now = 0.0
+        self.user_resolver = UserResolver(self.telemetry, timer=lambda: self.now)
+        self.bot = Mock()
+        self.bot.get_guild.return_value = None
+        self.user_resolver.set_bot_client(self.bot)
+
+    async def test_fallback_name_expires_and_is_retried(self):
+        fallback = await self.user_resolver.get_display_name(self.GUILD_ID, self.USER_ID)
+        self.assertEqual(fallback, f"User(ID:{self.USER_ID})")
+
+        # The guild becomes resolvable, but the fallback is still fresh
+        guild = Mock()
+        guild.get_member.return_value = Mock(display_name="Alice")
+        self.bot.get_guild.return_value = guild
+        self.assertEqual(await self.user_resolver.get_display_name(self.GUILD_ID, self.USER_ID), fallback)
+
+        self.now += FALLBACK_NAME_TTL_SECONDS + 1
+        self.assertEqual(await self.user_resolver.get_display_name(self.GUILD_ID, self.USER_ID), "Alice")
+
+    async def test_resolved_name_does_not_expire(self):
+        guild = Mock()
+        guild.get_member.return_value = Mock(display_name="Alice")
+        self.bot.get_guild.return_value = guild
+        self.assertEqual(await self.user_resolver.get_display_name(self.GUILD_ID, self.USER_ID), "Alice")
+
+        self.now += FALLBACK_NAME_TTL_SECONDS + 1
+        self.assertEqual(await self.user_resolver.get_display_name(self.GUILD_ID, self.USER_ID), "Alice")
+        guild.get_member.assert_called_once_with(self.USER_ID)
+
+    async def test_concurrent_misses_share_one_lookup(self):
+        release = asyncio.Event()
+
+        async def fetch_member(user_id):
+            await release.wait()
+            return Mock(display_name="Alice")
+
+        guild = Mock()
+        guild.get_member.return_value = None
+        guild.fetch_member = AsyncMock(side_effect=fetch_member)
+        self.bot.get_guild.return_value = guild
+
+        lookups = [
+            asyncio.create_task(self.user_resolver.get_display_name(self.GUILD_ID, self.USER_ID)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)  # let every caller register before the fetch completes
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*lookups), ["Alice"] * 3)
+        guild.fetch_member.assert_awaited_once_with(self.USER_ID)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,19 +5,25 @@ from null_telemetry import NullTelemetry
 
 
 class TestResponseSummarizer(unittest.IsolatedAsyncioTestCase):
+    # Small enough to keep payloads tiny, large enough for a non-zero summarization target
+    MAX_LENGTH = 200
+
+    @classmethod
+    def setUpClass(cls):
+        cls.telemetry = NullTelemetry()
+
     def setUp(self):
         # Create mock gemma client
         self.mock_gemma_client = Mock()
         self.mock_gemma_client.generate_content = AsyncMock()
 
-        self.telemetry = NullTelemetry()
         self.summarizer = ResponseSummarizer(self.mock_gemma_client, self.telemetry)
 
     async def test_short_response_passthrough(self):
         """Test that responses within limit are returned unchanged"""
         short_response = "This is a short response"
 
-        result = await self.summarizer.process_response(short_response, max_length=2000)
+        result = await self.summarizer.process_response(short_response, max_length=self.MAX_LENGTH)
 
         self.assertEqual(result, short_response)
         # Gemma client should not be called for short responses
@@ -25,40 +31,40 @@ class TestResponseSummarizer(unittest.IsolatedAsyncioTestCase):
 
     async def test_successful_summarization(self):
         """Test successful summarization of long response"""
-        long_response = "x" * 2500  # Response longer than 2000 chars
-        summarized_response = "x" * 1500  # Summarized version within limit
+        long_response = "x" * (self.MAX_LENGTH + 50)  # Response over the limit
+        summarized_response = "x" * (self.MAX_LENGTH - 50)  # Summarized version within limit
 
         self.mock_gemma_client.generate_content.return_value = summarized_response
 
-        result = await self.summarizer.process_response(long_response, max_length=2000)
+        result = await self.summarizer.process_response(long_response, max_length=self.MAX_LENGTH)
 
         self.assertEqual(result, summarized_response)
         self.mock_gemma_client.generate_content.assert_called_once()
 
     async def test_summarization_still_too_long_fallback(self):
         """Test fallback to truncation when summarization is still too long"""
-        long_response = "x" * 2500  # Response longer than 2000 chars
-        still_long_summary = "y" * 2100  # Summary still too long
+        long_response = "x" * (self.MAX_LENGTH + 50)  # Response over the limit
+        still_long_summary = "y" * (self.MAX_LENGTH + 10)  # Summary still too long
 
         self.mock_gemma_client.generate_content.return_value = still_long_summary
 
-        result = await self.summarizer.process_response(long_response, max_length=2000)
+        result = await self.summarizer.process_response(long_response, max_length=self.MAX_LENGTH)
 
         # Should fallback to truncation of original response
-        expected_truncated = long_response[:1997] + "..."
+        expected_truncated = long_response[: self.MAX_LENGTH - 3] + "..."
         self.assertEqual(result, expected_truncated)
         self.mock_gemma_client.generate_content.assert_called_once()
 
     async def test_summarization_exception_fallback(self):
         """Test fallback to truncation when summarization raises exception"""
-        long_response = "x" * 2500  # Response longer than 2000 chars
+        long_response = "x" * (self.MAX_LENGTH + 50)  # Response over the limit
 
         self.mock_gemma_client.generate_content.side_effect = Exception("API error")
 
-        result = await self.summarizer.process_response(long_response, max_length=2000)
+        result = await self.summarizer.process_response(long_response, max_length=self.MAX_LENGTH)
 
         # Should fallback to truncation of original response
-        expected_truncated = long_response[:1997] + "..."
+        expected_truncated = long_response[: self.MAX_LENGTH - 3] + "..."
         self.assertEqual(result, expected_truncated)
         self.mock_gemma_client.generate_content.assert_called_once()
 
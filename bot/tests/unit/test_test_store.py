@@ -102,30 +102,20 @@ class TestTestStore(unittest.IsolatedAsyncioTestCase):
 
     def test_message_count_by_date(self):
         """Test message count distribution across the week."""
-        # Monday: 10 messages (busy opening day)
-        self.assertEqual(self.test_store.get_message_count_for_date(date(1905, 3, 3)), 10)
-
-        # Tuesday: 8 messages (continued discussions)
-        self.assertEqual(self.test_store.get_message_count_for_date(date(1905, 3, 4)), 8)
-
-        # Wednesday: 8 messages (matrix vs wave mechanics debate)
-        self.assertEqual(self.test_store.get_message_count_for_date(date(1905, 3, 5)), 8)
-
-        # Thursday: 8 messages (experimental results and matter waves)
-        self.assertEqual(self.test_store.get_message_count_for_date(date(1905, 3, 6)), 8)
-
-        # Friday: 7 messages (general relativity discussions)
-        self.assertEqual(self.test_store.get_message_count_for_date(date(1905, 3, 7)), 7)
-
-        # Saturday: 8 messages (measurement problem and interpretation)
-        self.assertEqual(self.test_store.get_message_count_for_date(date(1905, 3, 8)), 8)
+        expected = {
+            date(1905, 3, 3): 10,  # Monday: busy opening day
+            date(1905, 3, 4): 8,  # Tuesday: continued discussions
+            date(1905, 3, 5): 8,  # Wednesday: matrix vs wave mechanics debate
+            date(1905, 3, 6): 8,  # Thursday: experimental results and matter waves
+            date(1905, 3, 7): 7,  # Friday: general relativity discussions
+            date(1905, 3, 8): 8,  # Saturday: measurement problem and interpretation
+            date(1905, 3, 9): 11,  # Sunday: reflective conclusions
+        }
 
-        # Sunday: 11 messages (reflective conclusions)
-        self.assertEqual(self.test_store.get_message_count_for_date(date(1905, 3, 9)), 11)
+        counts = {day: self.test_store.get_message_count_for_date(day) for day in expected}
 
-        # Total should be 60 (10+8+8+8+7+8+11)
-        total = sum(self.test_store.get_message_count_for_date(date(1905, 3, d)) for d in range(3, 10))
-        self.assertEqual(total, self.test_store.total_message_count)
+        self.assertEqual(counts, expected)
+        self.assertEqual(sum(counts.values()), self.test_store.total_message_count)
 
     def test_mention_processing(self):
         """Test that physicist name mentions are converted to Discord mentions."""
@@ -134,15 +124,7 @@ class TestTestStore(unittest.IsolatedAsyncioTestCase):
         einstein_id = self.test_store.physicist_ids["Einstein"]
 
         # Look for the specific message: "Max, Werner, I remain uncomfortable..."
-        target_message = None
-        for message in self.test_store._messages:
-            if (
-                message.timestamp.date() == target_date
-                and message.user_id == einstein_id
-                and "remain uncomfortable" in message.message_text
-            ):
-                target_message = message
-                break
+        target_message = self.test_store.find_message(target_date, einstein_id, "remain uncomfortable")
 
         # Should find Einstein's message
         self.assertIsNotNone(target_message, "Should find Einstein's message about being uncomfortable")
@@ -20,37 +20,54 @@ class AsyncContextManager:
         pass
 
 
+class FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(self, status: int, data: dict):
+        self.status = status
+        self._data = data
+
+    async def json(self) -> dict:
+        return self._data
+
+
+class FakeSession:
+    """Session whose post() replays a scripted sequence of exceptions and responses."""
+
+    def __init__(self, responses: list):
+        self._responses = iter(responses)
+        self.post_calls = 0
+
+    def post(self, *args, **kwargs) -> AsyncContextManager:
+        self.post_calls += 1
+        response = next(self._responses)
+        if isinstance(response, Exception):
+            raise response
+        return AsyncContextManager(response)
+
+
 class TestTinyURLClient(unittest.IsolatedAsyncioTestCase):
+    @patch("asyncio.sleep", new_callable=AsyncMock)
     @patch("tinyurl_client.aiohttp.ClientSession")
-    async def test_shorten_retries_on_network_error_then_succeeds(self, mock_session_cls: MagicMock):
+    async def test_shorten_retries_on_network_error_then_succeeds(
+        self, mock_session_cls: MagicMock, mock_sleep: AsyncMock
+    ):
         success_response = {
             "code": 0,
             "data": {"tiny_url": "https://tinyurl.com/abc123"},
             "errors": [],
         }
 
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=success_response)
-
-        call_count = 0
-
-        def post_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise aiohttp.ClientError("Network error")
-            return AsyncContextManager(mock_response)
-
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(side_effect=post_side_effect)
-        mock_session_cls.return_value = AsyncContextManager(mock_session)
+        session = FakeSession([aiohttp.ClientError("Network error"), FakeResponse(200, success_response)])
+        mock_session_cls.return_value = AsyncContextManager(session)
 
         client = TinyURLClient(api_token="test", telemetry=NullTelemetry(), max_tries=3)
         result = await client.shorten("https://example.com/long")
 
         self.assertEqual(result, "https://tinyurl.com/abc123")
-        self.assertEqual(call_count, 2)
+        self.assertEqual(session.post_calls, 2)
+        # The backoff delay between attempts is skipped rather than slept for real
+        mock_sleep.assert_awaited_once()
 
 
 if __name__ == "__main__":
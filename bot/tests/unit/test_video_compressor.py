@@ -1,4 +1,5 @@
 import unittest
+from itertools import chain, repeat
 
 from video_compressor import _filter_crop_outliers, _CROP_MIN_FRAMES
 
@@ -7,16 +8,15 @@ class TestFilterCropOutliers(unittest.TestCase):
     """Tests for frequency-based crop outlier removal."""
 
     def test_stable_frames_returns_single_value(self):
-        tuples = [(704, 480, 12, 418)] * 100
-        result = _filter_crop_outliers(tuples)
+        result = _filter_crop_outliers(repeat((704, 480, 12, 418), 100))
 
         self.assertEqual(result, [(704, 480, 12, 418)])
 
     def test_frames_at_threshold_kept(self):
-        base = [(704, 492, 12, 418)] * 100
-        borderline = [(704, 496, 12, 415)] * _CROP_MIN_FRAMES
+        base = repeat((704, 492, 12, 418), 100)
+        borderline = repeat((704, 496, 12, 415), _CROP_MIN_FRAMES)
 
-        result = _filter_crop_outliers(base + borderline)
+        result = _filter_crop_outliers(chain(base, borderline))
 
         self.assertEqual(len(result), 2)
         self.assertIn((704, 492, 12, 418), result)
@@ -24,11 +24,11 @@ class TestFilterCropOutliers(unittest.TestCase):
 
     def test_mixed_frequencies(self):
         """Only values above the threshold survive."""
-        common_a = [(700, 490, 12, 420)] * 50
-        common_b = [(702, 492, 10, 418)] * 30
-        rare = [(718, 906, 0, 0)] * 3
+        common_a = repeat((700, 490, 12, 420), 50)
+        common_b = repeat((702, 492, 10, 418), 30)
+        rare = repeat((718, 906, 0, 0), 3)
 
-        result = _filter_crop_outliers(common_a + common_b + rare)
+        result = _filter_crop_outliers(chain(common_a, common_b, rare))
 
         self.assertEqual(len(result), 2)
         self.assertIn((700, 490, 12, 420), result)
@@ -1,16 +1,53 @@
 import unittest
 from unittest.mock import AsyncMock, Mock, patch
 
-from cobalt_client import CobaltClient, VideoResult
+from cobalt_client import VideoResult
 from null_telemetry import NullTelemetry
-from tinyurl_client import TinyURLClient
-from video_compressor import CropBox, VideoCompressor
-from video_embedder import VideoEmbedder
+from video_compressor import CropBox
+from video_embedder import VideoEmbed, VideoEmbedder
+
+
+class _StubCobaltClient:
+    """Stands in for CobaltClient; extract_video resolves every URL to ``result``."""
+
+    def __init__(self, result: VideoResult):
+        self.extract_video = AsyncMock(return_value=result)
+
+
+class _StubVideoCompressor:
+    """Stands in for VideoCompressor with canned crop analysis and compression output."""
+
+    def __init__(self, crop: CropBox | None = None, compressed: bytes | None = None):
+        self.analyze_crop = AsyncMock(return_value=crop)
+        self.compress = AsyncMock(return_value=compressed)
+
+
+class _StubTinyURLClient:
+    """Stands in for TinyURLClient; shorten returns ``short_url``."""
+
+    def __init__(self, short_url: str | None = None):
+        self.shorten = AsyncMock(return_value=short_url)
+
+
+class _CannedDownloadVideoEmbedder(VideoEmbedder):
+    """VideoEmbedder whose download step returns canned bytes instead of hitting the network."""
+
+    def __init__(self, *args, downloaded: bytes | None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.downloaded = downloaded
+
+    async def _download_video(self, url: str, max_bytes: int) -> bytes | None:
+        return self.downloaded
+
+
+# Patched in as the Discord attachment limit so "oversized" payloads stay tiny
+_TEST_FILE_SIZE_LIMIT = 1024
 
 
 class TestFindVideoUrls(unittest.TestCase):
-    def setUp(self):
-        self.embedder = VideoEmbedder(Mock(), Mock(), Mock(), NullTelemetry())
+    @classmethod
+    def setUpClass(cls):
+        cls.embedder = VideoEmbedder(Mock(), Mock(), Mock(), NullTelemetry())
 
     def test_find_twitter_url(self):
         urls = self.embedder.find_video_urls("check this https://twitter.com/user/status/123")
@@ -34,234 +71,169 @@ class TestFindVideoUrls(unittest.TestCase):
         )
         self.assertEqual(urls, ["https://www.reddit.com/r/PublicFreakout/comments/1qwl6es/loud_fck_ice_chants/"])
 
+    def test_find_multiple_urls_in_message_order(self):
+        urls = self.embedder.find_video_urls(
+            "https://redd.it/abc then https://x.com/user/status/1 and https://www.instagram.com/reel/XYZ/"
+        )
+        self.assertEqual(
+            urls,
+            ["https://redd.it/abc", "https://x.com/user/status/1", "https://www.instagram.com/reel/XYZ"],
+        )
+
     def test_find_ignores_non_video_twitter(self):
         urls = self.embedder.find_video_urls("https://twitter.com/user")
         self.assertEqual(urls, [])
 
 
-class TestProcessUrl(unittest.IsolatedAsyncioTestCase):
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_download_returns_bytes_creates_attachment(self, mock_download: AsyncMock):
-        mock_download.return_value = b"video data"
+class _ProcessUrlTestBase(unittest.IsolatedAsyncioTestCase):
+    """Shares the telemetry and the immutable Cobalt results across process_url tests."""
 
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(
-                url="https://cdn.example.com/video.mp4",
-                filename="video.mp4",
-            )
-        )
-        compressor = Mock(spec=VideoCompressor)
-        compressor.analyze_crop = AsyncMock(return_value=None)
-        tinyurl = Mock(spec=TinyURLClient)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.telemetry = NullTelemetry()
+        cls.redirect_result = VideoResult(url="https://cdn.example.com/video.mp4", filename="video.mp4")
+        cls.tunnel_result = VideoResult(url="https://cobalt.internal/tunnel/abc", filename="video.mp4", is_tunnel=True)
 
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
-        result = await embedder.process_url("https://x.com/user/status/123")
 
-        self.assertEqual(result.file_data, b"video data")
-        self.assertEqual(result.filename, "video.mp4")
-        compressor.compress.assert_not_called()
-        tinyurl.shorten.assert_not_called()
+class TestProcessUrl(_ProcessUrlTestBase):
+    SOURCE_URL = "https://x.com/user/status/123"
+    SHORT_URL = "https://tinyurl.com/abc123"
 
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_oversized_tunnel_video_compresses_successfully(self, mock_download: AsyncMock):
-        large_data = b"x" * (11 * 1024 * 1024)
-        mock_download.return_value = large_data
-
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(
-                url="https://cobalt.internal/tunnel/abc",
-                filename="video.webm",
-                is_tunnel=True,
-            )
-        )
-        compressed_data = b"small" * 100
-        compressor = Mock(spec=VideoCompressor)
-        compressor.compress = AsyncMock(return_value=compressed_data)
-        tinyurl = Mock(spec=TinyURLClient)
+    async def test_download_returns_bytes_creates_attachment(self):
+        cobalt = _StubCobaltClient(self.redirect_result)
+        compressor = _StubVideoCompressor()
+        tinyurl = _StubTinyURLClient()
 
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
-        result = await embedder.process_url("https://x.com/user/status/123")
+        embedder = _CannedDownloadVideoEmbedder(cobalt, compressor, tinyurl, self.telemetry, downloaded=b"video data")
+        result = await embedder.process_url(self.SOURCE_URL)
 
-        self.assertEqual(result.file_data, compressed_data)
+        self.assertEqual(result.file_data, b"video data")
         self.assertEqual(result.filename, "video.mp4")
-        compressor.compress.assert_awaited_once_with(large_data, "video.webm")
-        tinyurl.shorten.assert_not_called()
-
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_oversized_redirect_falls_back_to_tinyurl(self, mock_download: AsyncMock):
-        large_data = b"x" * (11 * 1024 * 1024)
-        mock_download.return_value = large_data
-
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(
-                url="https://cdn.example.com/video.mp4",
-                filename="video.mp4",
-                is_tunnel=False,
-            )
-        )
-        compressor = Mock(spec=VideoCompressor)
-        tinyurl = Mock(spec=TinyURLClient)
-        tinyurl.shorten = AsyncMock(return_value="https://tinyurl.com/abc123")
-
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
-        result = await embedder.process_url("https://x.com/user/status/123")
-
-        self.assertIsNone(result.file_data)
-        self.assertEqual(result.short_url, "https://tinyurl.com/abc123")
-        compressor.compress.assert_not_called()
-        tinyurl.shorten.assert_awaited_once()
-
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_compression_fails_tunnel_returns_none(self, mock_download: AsyncMock):
-        large_data = b"x" * (11 * 1024 * 1024)
-        mock_download.return_value = large_data
-
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(
-                url="https://cobalt.internal/tunnel/abc",
-                filename="video.mp4",
-                is_tunnel=True,
-            )
-        )
-        compressor = Mock(spec=VideoCompressor)
-        compressor.compress = AsyncMock(return_value=None)
-        tinyurl = Mock(spec=TinyURLClient)
-
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
-        result = await embedder.process_url("https://x.com/user/status/123")
-
-        self.assertIsNone(result)
-        compressor.compress.assert_awaited_once()
-        tinyurl.shorten.assert_not_called()
-
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_download_returns_none_redirect_creates_short_url(self, mock_download: AsyncMock):
-        mock_download.return_value = None
-
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(
-                url="https://cdn.example.com/video.mp4",
-                filename="video.mp4",
-                is_tunnel=False,
-            )
-        )
-        compressor = Mock(spec=VideoCompressor)
-        tinyurl = Mock(spec=TinyURLClient)
-        tinyurl.shorten = AsyncMock(return_value="https://tinyurl.com/abc123")
-
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
-        result = await embedder.process_url("https://x.com/user/status/123")
-
-        self.assertIsNone(result.file_data)
-        self.assertEqual(result.short_url, "https://tinyurl.com/abc123")
-        tinyurl.shorten.assert_awaited_once()
         compressor.compress.assert_not_called()
-
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_download_returns_none_tunnel_returns_none(self, mock_download: AsyncMock):
-        mock_download.return_value = None
-
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(
-                url="https://cobalt.internal/tunnel/abc",
-                filename="video.mp4",
-                is_tunnel=True,
-            )
-        )
-        compressor = Mock(spec=VideoCompressor)
-        tinyurl = Mock(spec=TinyURLClient)
-
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
-        result = await embedder.process_url("https://x.com/user/status/123")
-
-        self.assertIsNone(result)
         tinyurl.shorten.assert_not_called()
-        compressor.compress.assert_not_called()
-
 
-class TestWithinLimitsCrop(unittest.IsolatedAsyncioTestCase):
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_significant_bars_triggers_compression(self, mock_download: AsyncMock):
-        mock_download.return_value = b"video data"
+    @patch("video_embedder.MAX_FILE_SIZE_BYTES", _TEST_FILE_SIZE_LIMIT)
+    async def test_oversized_download(self):
+        """Oversized tunnel videos are compressed; oversized redirects fall back to TinyURL."""
+        large_data = b"x" * (_TEST_FILE_SIZE_LIMIT + 1)
+        compressed_data = bytes(500)
+        webm_tunnel = VideoResult(url="https://cobalt.internal/tunnel/abc", filename="video.webm", is_tunnel=True)
+        cases = [
+            # (name, cobalt result, compressor output, expected embed)
+            (
+                "tunnel compresses",
+                webm_tunnel,
+                compressed_data,
+                VideoEmbed(file_data=compressed_data, filename="video.mp4", source_url=self.SOURCE_URL),
+            ),
+            (
+                "redirect falls back to tinyurl",
+                self.redirect_result,
+                None,
+                VideoEmbed(short_url=self.SHORT_URL, source_url=self.SOURCE_URL),
+            ),
+            ("tunnel compression fails", self.tunnel_result, None, None),
+        ]
+
+        for name, cobalt_result, compressed, expected in cases:
+            with self.subTest(name):
+                compressor = _StubVideoCompressor(compressed=compressed)
+                tinyurl = _StubTinyURLClient(short_url=self.SHORT_URL)
+                embedder = _CannedDownloadVideoEmbedder(
+                    _StubCobaltClient(cobalt_result), compressor, tinyurl, self.telemetry, downloaded=large_data
+                )
+
+                result = await embedder.process_url(self.SOURCE_URL)
+
+                self.assertEqual(result, expected)
+                if cobalt_result.is_tunnel:
+                    compressor.compress.assert_awaited_once_with(large_data, cobalt_result.filename)
+                    tinyurl.shorten.assert_not_called()
+                else:
+                    compressor.compress.assert_not_called()
+                    tinyurl.shorten.assert_awaited_once_with(cobalt_result.url)
+
+    async def test_download_returns_none(self):
+        """A redirect too large to download is shortened; a tunnel has no URL to fall back to."""
+        cases = [
+            # (name, cobalt result, expected embed)
+            (
+                "redirect creates short url",
+                self.redirect_result,
+                VideoEmbed(short_url=self.SHORT_URL, source_url=self.SOURCE_URL),
+            ),
+            ("tunnel returns none", self.tunnel_result, None),
+        ]
+
+        for name, cobalt_result, expected in cases:
+            with self.subTest(name):
+                compressor = _StubVideoCompressor()
+                tinyurl = _StubTinyURLClient(short_url=self.SHORT_URL)
+                embedder = _CannedDownloadVideoEmbedder(
+                    _StubCobaltClient(cobalt_result), compressor, tinyurl, self.telemetry, downloaded=None
+                )
+
+                result = await embedder.process_url(self.SOURCE_URL)
+
+                self.assertEqual(result, expected)
+                compressor.compress.assert_not_called()
+                if cobalt_result.is_tunnel:
+                    tinyurl.shorten.assert_not_called()
+                else:
+                    tinyurl.shorten.assert_awaited_once_with(cobalt_result.url)
+
+
+class TestWithinLimitsCrop(_ProcessUrlTestBase):
+    async def test_significant_bars_triggers_compression(self):
         crop = CropBox(w=1920, h=800, x=0, y=140, pixel_reduction=0.26)
         compressed = b"cropped video"
 
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(url="https://cdn.example.com/video.mp4", filename="video.mp4")
-        )
-        compressor = Mock(spec=VideoCompressor)
-        compressor.analyze_crop = AsyncMock(return_value=crop)
-        compressor.compress = AsyncMock(return_value=compressed)
-        tinyurl = Mock(spec=TinyURLClient)
+        cobalt = _StubCobaltClient(self.redirect_result)
+        compressor = _StubVideoCompressor(crop=crop, compressed=compressed)
+        tinyurl = _StubTinyURLClient()
 
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
+        embedder = _CannedDownloadVideoEmbedder(cobalt, compressor, tinyurl, self.telemetry, downloaded=b"video data")
         result = await embedder.process_url("https://x.com/user/status/123")
 
         self.assertEqual(result.file_data, compressed)
         self.assertEqual(result.filename, "video.mp4")
         compressor.compress.assert_awaited_once_with(b"video data", "video.mp4", crop=crop)
 
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_minor_bars_returned_as_is(self, mock_download: AsyncMock):
-        mock_download.return_value = b"video data"
+    async def test_minor_bars_returned_as_is(self):
         crop = CropBox(w=1920, h=1026, x=0, y=27, pixel_reduction=0.05)
 
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(url="https://cdn.example.com/video.mp4", filename="video.mp4")
-        )
-        compressor = Mock(spec=VideoCompressor)
-        compressor.analyze_crop = AsyncMock(return_value=crop)
-        tinyurl = Mock(spec=TinyURLClient)
+        cobalt = _StubCobaltClient(self.redirect_result)
+        compressor = _StubVideoCompressor(crop=crop)
+        tinyurl = _StubTinyURLClient()
 
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
+        embedder = _CannedDownloadVideoEmbedder(cobalt, compressor, tinyurl, self.telemetry, downloaded=b"video data")
         result = await embedder.process_url("https://x.com/user/status/123")
 
         self.assertEqual(result.file_data, b"video data")
         self.assertEqual(result.filename, "video.mp4")
         compressor.compress.assert_not_called()
 
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_no_crop_detected_returned_as_is(self, mock_download: AsyncMock):
-        mock_download.return_value = b"video data"
+    async def test_no_crop_detected_returned_as_is(self):
+        cobalt = _StubCobaltClient(self.redirect_result)
+        compressor = _StubVideoCompressor()
+        tinyurl = _StubTinyURLClient()
 
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(url="https://cdn.example.com/video.mp4", filename="video.mp4")
-        )
-        compressor = Mock(spec=VideoCompressor)
-        compressor.analyze_crop = AsyncMock(return_value=None)
-        tinyurl = Mock(spec=TinyURLClient)
-
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
+        embedder = _CannedDownloadVideoEmbedder(cobalt, compressor, tinyurl, self.telemetry, downloaded=b"video data")
         result = await embedder.process_url("https://x.com/user/status/123")
 
         self.assertEqual(result.file_data, b"video data")
         self.assertEqual(result.filename, "video.mp4")
         compressor.compress.assert_not_called()
 
-    @patch.object(VideoEmbedder, "_download_video")
-    async def test_crop_compression_fails_returned_as_is(self, mock_download: AsyncMock):
-        mock_download.return_value = b"video data"
+    async def test_crop_compression_fails_returned_as_is(self):
         crop = CropBox(w=1920, h=800, x=0, y=140, pixel_reduction=0.26)
 
-        cobalt = Mock(spec=CobaltClient)
-        cobalt.extract_video = AsyncMock(
-            return_value=VideoResult(url="https://cdn.example.com/video.mp4", filename="video.mp4")
-        )
-        compressor = Mock(spec=VideoCompressor)
-        compressor.analyze_crop = AsyncMock(return_value=crop)
-        compressor.compress = AsyncMock(return_value=None)
-        tinyurl = Mock(spec=TinyURLClient)
+        cobalt = _StubCobaltClient(self.redirect_result)
+        compressor = _StubVideoCompressor(crop=crop, compressed=None)
+        tinyurl = _StubTinyURLClient()
 
-        embedder = VideoEmbedder(cobalt, compressor, tinyurl, NullTelemetry())
+        embedder = _CannedDownloadVideoEmbedder(cobalt, compressor, tinyurl, self.telemetry, downloaded=b"video data")
         result = await embedder.process_url("https://x.com/user/status/123")
 
         self.assertEqual(result.file_data, b"video data")
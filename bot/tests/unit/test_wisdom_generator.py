@@ -4,24 +4,39 @@ import unittest
 from unittest.mock import AsyncMock, Mock
 
 from wisdom_generator import WisdomGenerator
+from conversation_formatter import ConversationFormatter
 from conversation_graph import ConversationMessage
 from null_telemetry import NullTelemetry
 from schemas import WisdomResponse
 
+_LANGUAGE_NAMES = {"en": "English", "ru": "Russian"}
+
+
+class _StubLanguageDetector:
+    """Stands in for LanguageDetector; names come from _LANGUAGE_NAMES so they track the detected code."""
+
+    def __init__(self, detected: str = "en"):
+        self.detect_language = AsyncMock(return_value=detected)
+        self.get_language_name = AsyncMock(side_effect=_LANGUAGE_NAMES.__getitem__)
+
 
 class TestWisdomGenerator(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.telemetry = NullTelemetry()
+
     def setUp(self) -> None:
         self.ai_client = Mock()
         self.ai_client.generate_content = AsyncMock()
 
-        self.language_detector = Mock()
-        self.language_detector.detect_language = AsyncMock(return_value="en")
-        self.language_detector.get_language_name = AsyncMock(return_value="English")
+        self.language_detector = _StubLanguageDetector()
 
-        self.conversation_formatter = Mock()
-        self.conversation_formatter.format_to_xml = AsyncMock(
-            return_value="<conversation_history>\n<message>Mock conversation</message>\n</conversation_history>"
+        # Real formatter; only the Discord-backed mention lookup is stubbed
+        self.user_resolver = Mock()
+        self.user_resolver.replace_user_mentions_with_names = AsyncMock(
+            side_effect=lambda text, guild_id: text.replace("<@12345>", "TestUser")
         )
+        self.conversation_formatter = ConversationFormatter(self.user_resolver)
 
         self.response_summarizer = Mock()
         self.response_summarizer.process_response = AsyncMock(side_effect=lambda x: x)
@@ -30,8 +45,6 @@ class TestWisdomGenerator(unittest.IsolatedAsyncioTestCase):
         self.memory_manager.get_memories = AsyncMock(return_value={})
         self.memory_manager.build_memory_prompt = AsyncMock(return_value="")
 
-        self.telemetry = NullTelemetry()
-
         # Mock trigger message
         self.mock_trigger_message = Mock()
         self.mock_trigger_message.content = "Test message"
@@ -77,13 +90,6 @@ class TestWisdomGenerator(unittest.IsolatedAsyncioTestCase):
 
     async def test_generate_wisdom_with_conversation_context(self) -> None:
         """Test that conversation context is included in the prompt."""
-        # Update mock to return actual formatted conversation
-        self.conversation_formatter.format_to_xml = AsyncMock(
-            return_value=(
-                "<conversation_history>\n<message><id>1</id><content>First message</content></message>"
-                "\n<message><id>2</id><content>Second message</content></message>\n</conversation_history>"
-            )
-        )
         self.ai_client.generate_content.return_value = WisdomResponse(
             answer="Wisdom from context.", reason="Drew on the conversation thread about messaging"
         )
@@ -124,7 +130,6 @@ class TestWisdomGenerator(unittest.IsolatedAsyncioTestCase):
     async def test_generate_wisdom_detects_language(self) -> None:
         """Test that language detection is called and used in prompt."""
         self.language_detector.detect_language.return_value = "ru"
-        self.language_detector.get_language_name.return_value = "Russian"
         self.ai_client.generate_content.return_value = WisdomResponse(
             answer="Мудрость", reason="Responded in Russian as detected"
         )
@@ -192,7 +197,10 @@ class TestWisdomGenerator(unittest.IsolatedAsyncioTestCase):
             guild_id=123,
         )
 
-        self.conversation_formatter.format_to_xml.assert_called_once()
+        self.user_resolver.replace_user_mentions_with_names.assert_awaited_once_with("Hello <@12345>", 123)
+        prompt = self.ai_client.generate_content.call_args.kwargs["prompt"]
+        self.assertIn("<content>Hello TestUser</content>", prompt)
+        self.assertNotIn("<@12345>", prompt)
 
     async def test_generate_wisdom_handles_none_response(self) -> None:
         """Test handling when AI returns None."""
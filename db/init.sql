@@ -4,6 +4,11 @@ CREATE TABLE messages (
     content TEXT NOT NULL
 );
 
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Lets the admin UI's substring search (ILIKE '%...%') use an index instead of scanning every message
+CREATE INDEX IF NOT EXISTS idx_messages_content_trgm ON messages USING gin (content gin_trgm_ops);
+
 CREATE TABLE jokes (
     source_message_id BIGINT REFERENCES messages(message_id) ON DELETE CASCADE,
     joke_message_id BIGINT REFERENCES messages(message_id) ON DELETE CASCADE,
@@ -11,6 +16,9 @@ CREATE TABLE jokes (
     PRIMARY KEY (source_message_id, joke_message_id)
 );
 
+-- The primary key covers lookups by source message; this covers lookups by joke message
+CREATE INDEX IF NOT EXISTS idx_jokes_joke_message ON jokes (joke_message_id);
+
 CREATE TABLE guild_configs (
     guild_id BIGINT PRIMARY KEY,
     archive_channel_id BIGINT DEFAULT 0,
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 from datetime import datetime, timezone as dt_timezone
@@ -92,8 +93,7 @@ async def jokes(request: Request, page: int = 1, search: str = ""):
         offset = (page - 1) * page_size
 
         search_query = search.strip()
-        jokes = await store.get_jokes(limit=page_size, offset=offset, search_query=search_query)
-        total_count = await store.get_jokes_count(search_query=search_query)
+        jokes, total_count = await store.get_jokes_page(limit=page_size, offset=offset, search_query=search_query)
 
         total_pages = (total_count + page_size - 1) // page_size
 
@@ -183,8 +183,11 @@ async def users(request: Request, page: int = 1, search: str = ""):
         offset = (page - 1) * page_size
 
         search_query = search.strip()
-        rows = await store.get_user_facts_rows(limit=page_size, offset=offset, search_query=search_query)
-        total_count = await store.get_user_facts_count(search_query=search_query)
+        # The page and the count use separate pool connections, so run them concurrently
+        rows, total_count = await asyncio.gather(
+            store.get_user_facts_rows(limit=page_size, offset=offset, search_query=search_query),
+            store.get_user_facts_count(search_query=search_query),
+        )
 
         total_pages = (total_count + page_size - 1) // page_size
 
@@ -280,8 +283,10 @@ async def tasks(request: Request, page: int = 1, search: str = ""):
         offset = (page - 1) * page_size
 
         search_query = search.strip()
-        rows = await store.get_scheduled_tasks_rows(limit=page_size, offset=offset, search_query=search_query)
-        total_count = await store.get_scheduled_tasks_count(search_query=search_query)
+        rows, total_count = await asyncio.gather(
+            store.get_scheduled_tasks_rows(limit=page_size, offset=offset, search_query=search_query),
+            store.get_scheduled_tasks_count(search_query=search_query),
+        )
 
         total_pages = (total_count + page_size - 1) // page_size
 
@@ -417,6 +422,12 @@ async def delete_scheduled_task(task_id: int):
         raise HTTPException(status_code=500, detail="Error deleting task")
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Open the database connection pool"""
+    await store.open()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up database connections on shutdown"""
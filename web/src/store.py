@@ -1,5 +1,4 @@
-import psycopg
-from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool
 from dataclasses import dataclass
 from datetime import datetime
 import logging
@@ -52,76 +51,107 @@ class WebStore:
     ):
         self._telemetry = telemetry
         self.connection_params = {"host": host, "port": port, "user": user, "password": password, "dbname": database}
-        self.conn: AsyncConnection | None = None
+        # Each request borrows its own connection so concurrent page loads don't queue behind one another.
+        # The admin UI runs a small fixed set of queries, so prepare each on first use rather than the fifth.
+        self.pool = AsyncConnectionPool(
+            kwargs={**self.connection_params, "prepare_threshold": 0}, min_size=1, max_size=10, open=False
+        )
 
-    async def _connect(self) -> AsyncConnection:
-        conn = await psycopg.AsyncConnection.connect(**self.connection_params)
-        return conn
-
-    async def _ensure_connection(self) -> None:
-        if self.conn is None or self.conn.closed:
-            if self.conn is not None:
-                try:
-                    await self.conn.close()
-                except Exception:
-                    pass
-            self.conn = await self._connect()
-
-    async def get_jokes(self, limit: int = 50, offset: int = 0, search_query: str = "") -> list[JokeRow]:
-        """Get paginated list of jokes with optional search filtering"""
-        async with self._telemetry.async_create_span("get_jokes") as span:
-            span.set_attribute("limit", limit)
-            span.set_attribute("offset", offset)
-            span.set_attribute("has_search", bool(search_query))
-            span.set_attribute("query_length", len(search_query))
+    async def open(self) -> None:
+        """Open the connection pool."""
+        await self.pool.open()
 
+    async def get_jokes_page(
+        self, limit: int = 50, offset: int = 0, search_query: str = ""
+    ) -> tuple[list[JokeRow], int]:
+        """Get a page of jokes with optional search filtering, along with the total count for pagination"""
+        async with self._telemetry.async_create_span(
+            "get_jokes_page",
+            attributes={
+                "limit": limit,
+                "offset": offset,
+                "has_search": bool(search_query),
+                "query_length": len(search_query),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
-                    search_pattern = f"%{search_query}%"
-                    await cur.execute(
-                        """
-                        SELECT j.source_message_id, j.joke_message_id, 
-                               m1.content as source_content, m2.content as joke_content,
-                               j.reaction_count
-                        FROM jokes j
-                        JOIN messages m1 ON j.source_message_id = m1.message_id
-                        JOIN messages m2 ON j.joke_message_id = m2.message_id
-                        WHERE m1.content ILIKE %s OR m2.content ILIKE %s
-                        ORDER BY j.source_message_id DESC
-                        LIMIT %s OFFSET %s
-                        """,
-                        (search_pattern, search_pattern, limit, offset),
-                    )
+                async with self.pool.connection() as conn, conn.cursor() as cur:
+                    # The total rides along as an extra column so the page and its count take one round trip
+                    if search_query:
+                        search_pattern = f"%{search_query}%"
+                        # Matching messages are found first, so the search can use the trigram index on
+                        # messages.content; an OR across the two joined columns would scan both instead
+                        await cur.execute(
+                            """
+                            WITH matches AS (SELECT message_id FROM messages WHERE content ILIKE %s)
+                            SELECT j.source_message_id, j.joke_message_id,
+                                   m1.content as source_content, m2.content as joke_content,
+                                   j.reaction_count, COUNT(*) OVER () as total_count
+                            FROM jokes j
+                            JOIN messages m1 ON j.source_message_id = m1.message_id
+                            JOIN messages m2 ON j.joke_message_id = m2.message_id
+                            WHERE j.source_message_id IN (SELECT message_id FROM matches)
+                               OR j.joke_message_id IN (SELECT message_id FROM matches)
+                            ORDER BY j.source_message_id DESC
+                            LIMIT %s OFFSET %s
+                            """,
+                            (search_pattern, limit, offset),
+                        )
+                    else:
+                        # Without a filter the page can be read straight off the jokes primary key; a window
+                        # count would force the whole join, so count the jokes table once instead
+                        await cur.execute(
+                            """
+                            SELECT j.source_message_id, j.joke_message_id,
+                                   m1.content as source_content, m2.content as joke_content,
+                                   j.reaction_count, (SELECT COUNT(*) FROM jokes) as total_count
+                            FROM jokes j
+                            JOIN messages m1 ON j.source_message_id = m1.message_id
+                            JOIN messages m2 ON j.joke_message_id = m2.message_id
+                            ORDER BY j.source_message_id DESC
+                            LIMIT %s OFFSET %s
+                            """,
+                            (limit, offset),
+                        )
                     results = await cur.fetchall()
-                    jokes = [JokeRow(*row) for row in results]
-                    span.set_attribute("returned_count", len(jokes))
-                    return jokes
+                jokes = [JokeRow(*row[:-1]) for row in results]
+                span.set_attribute("returned_count", len(jokes))
+                if results:
+                    return jokes, results[0][-1]
             except Exception as e:
                 logger.error(f"Error fetching jokes: {e}", exc_info=True)
                 span.record_exception(e)
-                return []
+                return [], 0
+
+        # A page past the end has no rows to carry the total, so count separately
+        return [], await self.get_jokes_count(search_query=search_query)
 
     async def get_jokes_count(self, search_query: str = "") -> int:
         """Get total count of jokes for pagination with optional search filtering"""
-        async with self._telemetry.async_create_span("get_jokes_count") as span:
-            span.set_attribute("has_search", bool(search_query))
-            span.set_attribute("query_length", len(search_query))
-
+        async with self._telemetry.async_create_span(
+            "get_jokes_count",
+            attributes={
+                "has_search": bool(search_query),
+                "query_length": len(search_query),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
-                    search_pattern = f"%{search_query}%"
-                    await cur.execute(
-                        """
-                        SELECT COUNT(*)
-                        FROM jokes j
-                        JOIN messages m1 ON j.source_message_id = m1.message_id
-                        JOIN messages m2 ON j.joke_message_id = m2.message_id
-                        WHERE m1.content ILIKE %s OR m2.content ILIKE %s
-                        """,
-                        (search_pattern, search_pattern),
-                    )
+                async with self.pool.connection() as conn, conn.cursor() as cur:
+                    if search_query:
+                        search_pattern = f"%{search_query}%"
+                        await cur.execute(
+                            """
+                            WITH matches AS (SELECT message_id FROM messages WHERE content ILIKE %s)
+                            SELECT COUNT(*)
+                            FROM jokes j
+                            WHERE j.source_message_id IN (SELECT message_id FROM matches)
+                               OR j.joke_message_id IN (SELECT message_id FROM matches)
+                            """,
+                            (search_pattern,),
+                        )
+                    else:
+                        # Both message ids reference messages, so the joins cannot drop rows
+                        await cur.execute("SELECT COUNT(*) FROM jokes")
                     result = await cur.fetchone()
                     count = result[0] if result else 0
                     span.set_attribute("total_count", count)
@@ -133,12 +163,14 @@ class WebStore:
 
     async def get_message_content(self, message_id: int) -> str | None:
         """Get content of a specific message"""
-        async with self._telemetry.async_create_span("get_message_content") as span:
-            span.set_attribute("message_id", message_id)
-
+        async with self._telemetry.async_create_span(
+            "get_message_content",
+            attributes={
+                "message_id": message_id,
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute("SELECT content FROM messages WHERE message_id = %s", (message_id,))
                     result = await cur.fetchone()
                     content = result[0] if result else None
@@ -151,18 +183,20 @@ class WebStore:
 
     async def update_message_content(self, message_id: int, new_content: str) -> bool:
         """Update the content of a message"""
-        async with self._telemetry.async_create_span("update_message_content") as span:
-            span.set_attribute("message_id", message_id)
-            span.set_attribute("content_length", len(new_content))
-
+        async with self._telemetry.async_create_span(
+            "update_message_content",
+            attributes={
+                "message_id": message_id,
+                "content_length": len(new_content),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute(
                         "UPDATE messages SET content = %s WHERE message_id = %s", (new_content, message_id)
                     )
                     rows_affected = cur.rowcount
-                    await self.conn.commit()
+                    await conn.commit()
 
                     success = rows_affected > 0
                     span.set_attribute("success", success)
@@ -174,14 +208,16 @@ class WebStore:
                 return False
 
     async def delete_joke(self, source_message_id: int, joke_message_id: int) -> bool:
-        """Delete a joke pair and clean up all orphaned messages"""
-        async with self._telemetry.async_create_span("delete_joke") as span:
-            span.set_attribute("source_message_id", source_message_id)
-            span.set_attribute("joke_message_id", joke_message_id)
-
+        """Delete a joke pair and clean up its messages if no other joke uses them"""
+        async with self._telemetry.async_create_span(
+            "delete_joke",
+            attributes={
+                "source_message_id": source_message_id,
+                "joke_message_id": joke_message_id,
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     # Delete the joke relationship
                     await cur.execute(
                         "DELETE FROM jokes WHERE source_message_id = %s AND joke_message_id = %s",
@@ -189,20 +225,20 @@ class WebStore:
                     )
                     joke_deleted = cur.rowcount > 0
 
-                    # Clean up all orphaned messages in one query
+                    # Messages are only ever stored as part of a joke pair, so only this pair's two
+                    # messages can have been orphaned; check just those instead of sweeping the table
                     await cur.execute(
                         """
-                        DELETE FROM messages 
-                        WHERE message_id NOT IN (
-                            SELECT DISTINCT source_message_id FROM jokes
-                            UNION
-                            SELECT DISTINCT joke_message_id FROM jokes
-                        )
-                        """
+                        DELETE FROM messages m
+                        WHERE m.message_id IN (%s, %s)
+                          AND NOT EXISTS (SELECT 1 FROM jokes j WHERE j.source_message_id = m.message_id)
+                          AND NOT EXISTS (SELECT 1 FROM jokes j WHERE j.joke_message_id = m.message_id)
+                        """,
+                        (source_message_id, joke_message_id),
                     )
                     orphans_deleted = cur.rowcount
 
-                    await self.conn.commit()
+                    await conn.commit()
                     span.set_attribute("success", joke_deleted)
                     span.set_attribute("orphans_deleted", orphans_deleted)
                     return joke_deleted
@@ -213,15 +249,17 @@ class WebStore:
 
     async def get_user_facts_rows(self, limit: int = 50, offset: int = 0, search_query: str = "") -> list[UserFactsRow]:
         """Get paginated list of user facts rows with optional search filtering."""
-        async with self._telemetry.async_create_span("get_user_facts_rows") as span:
-            span.set_attribute("limit", limit)
-            span.set_attribute("offset", offset)
-            span.set_attribute("has_search", bool(search_query))
-            span.set_attribute("query_length", len(search_query))
-
+        async with self._telemetry.async_create_span(
+            "get_user_facts_rows",
+            attributes={
+                "limit": limit,
+                "offset": offset,
+                "has_search": bool(search_query),
+                "query_length": len(search_query),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     if search_query:
                         await cur.execute(
                             """
@@ -254,13 +292,15 @@ class WebStore:
 
     async def get_user_facts_count(self, search_query: str = "") -> int:
         """Get total count of user facts rows for pagination with optional search filtering."""
-        async with self._telemetry.async_create_span("get_user_facts_count") as span:
-            span.set_attribute("has_search", bool(search_query))
-            span.set_attribute("query_length", len(search_query))
-
+        async with self._telemetry.async_create_span(
+            "get_user_facts_count",
+            attributes={
+                "has_search": bool(search_query),
+                "query_length": len(search_query),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     if search_query:
                         await cur.execute(
                             "SELECT COUNT(*) FROM user_facts WHERE memory_blob ILIKE %s",
@@ -279,13 +319,15 @@ class WebStore:
 
     async def get_user_facts_blob(self, guild_id: int, user_id: int) -> str | None:
         """Get the memory_blob for a single (guild_id, user_id) pair."""
-        async with self._telemetry.async_create_span("get_user_facts_blob") as span:
-            span.set_attribute("guild_id", guild_id)
-            span.set_attribute("user_id", user_id)
-
+        async with self._telemetry.async_create_span(
+            "get_user_facts_blob",
+            attributes={
+                "guild_id": guild_id,
+                "user_id": user_id,
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute(
                         "SELECT memory_blob FROM user_facts WHERE guild_id = %s AND user_id = %s",
                         (guild_id, user_id),
@@ -301,14 +343,16 @@ class WebStore:
 
     async def update_user_facts_blob(self, guild_id: int, user_id: int, memory_blob: str) -> bool:
         """Update the memory_blob for an existing user facts row."""
-        async with self._telemetry.async_create_span("update_user_facts_blob") as span:
-            span.set_attribute("guild_id", guild_id)
-            span.set_attribute("user_id", user_id)
-            span.set_attribute("content_length", len(memory_blob))
-
+        async with self._telemetry.async_create_span(
+            "update_user_facts_blob",
+            attributes={
+                "guild_id": guild_id,
+                "user_id": user_id,
+                "content_length": len(memory_blob),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute(
                         """
                         UPDATE user_facts
@@ -318,7 +362,7 @@ class WebStore:
                         (memory_blob, guild_id, user_id),
                     )
                     rows_affected = cur.rowcount
-                    await self.conn.commit()
+                    await conn.commit()
                     success = rows_affected > 0
                     span.set_attribute("success", success)
                     span.set_attribute("rows_affected", rows_affected)
@@ -330,19 +374,21 @@ class WebStore:
 
     async def delete_user_facts(self, guild_id: int, user_id: int) -> bool:
         """Delete a user facts row by (guild_id, user_id)."""
-        async with self._telemetry.async_create_span("delete_user_facts") as span:
-            span.set_attribute("guild_id", guild_id)
-            span.set_attribute("user_id", user_id)
-
+        async with self._telemetry.async_create_span(
+            "delete_user_facts",
+            attributes={
+                "guild_id": guild_id,
+                "user_id": user_id,
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute(
                         "DELETE FROM user_facts WHERE guild_id = %s AND user_id = %s",
                         (guild_id, user_id),
                     )
                     rows_affected = cur.rowcount
-                    await self.conn.commit()
+                    await conn.commit()
                     success = rows_affected > 0
                     span.set_attribute("success", success)
                     span.set_attribute("rows_affected", rows_affected)
@@ -356,14 +402,16 @@ class WebStore:
         self, limit: int = 50, offset: int = 0, search_query: str = ""
     ) -> list[ScheduledTaskRow]:
         """Get paginated list of scheduled tasks with optional search on prompt text."""
-        async with self._telemetry.async_create_span("get_scheduled_tasks_rows") as span:
-            span.set_attribute("limit", limit)
-            span.set_attribute("offset", offset)
-            span.set_attribute("has_search", bool(search_query))
-
+        async with self._telemetry.async_create_span(
+            "get_scheduled_tasks_rows",
+            attributes={
+                "limit": limit,
+                "offset": offset,
+                "has_search": bool(search_query),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     if search_query:
                         await cur.execute(
                             """
@@ -400,12 +448,14 @@ class WebStore:
 
     async def get_scheduled_tasks_count(self, search_query: str = "") -> int:
         """Total scheduled tasks count for pagination, with optional search."""
-        async with self._telemetry.async_create_span("get_scheduled_tasks_count") as span:
-            span.set_attribute("has_search", bool(search_query))
-
+        async with self._telemetry.async_create_span(
+            "get_scheduled_tasks_count",
+            attributes={
+                "has_search": bool(search_query),
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     if search_query:
                         await cur.execute(
                             "SELECT COUNT(*) FROM scheduled_tasks WHERE prompt ILIKE %s",
@@ -424,12 +474,14 @@ class WebStore:
 
     async def get_scheduled_task(self, task_id: int) -> ScheduledTaskRow | None:
         """Retrieve a single scheduled task by ID."""
-        async with self._telemetry.async_create_span("get_scheduled_task") as span:
-            span.set_attribute("task_id", task_id)
-
+        async with self._telemetry.async_create_span(
+            "get_scheduled_task",
+            attributes={
+                "task_id": task_id,
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute(
                         """
                         SELECT task_id, guild_id, channel_id, creator_user_id, prompt,
@@ -460,14 +512,16 @@ class WebStore:
         next_run_at: datetime,
     ) -> bool:
         """Update mutable fields of a scheduled task. Returns True if a row was updated."""
-        async with self._telemetry.async_create_span("update_scheduled_task") as span:
-            span.set_attribute("task_id", task_id)
-            span.set_attribute("has_cron", cron_expression is not None)
-            span.set_attribute("timezone", timezone)
-
+        async with self._telemetry.async_create_span(
+            "update_scheduled_task",
+            attributes={
+                "task_id": task_id,
+                "has_cron": cron_expression is not None,
+                "timezone": timezone,
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute(
                         """
                         UPDATE scheduled_tasks
@@ -481,7 +535,7 @@ class WebStore:
                         (prompt, cron_expression, timezone, next_run_at, task_id),
                     )
                     rows = cur.rowcount
-                    await self.conn.commit()
+                    await conn.commit()
                     span.set_attribute("rows_affected", rows)
                     return rows > 0
             except Exception as e:
@@ -491,15 +545,17 @@ class WebStore:
 
     async def delete_scheduled_task(self, task_id: int) -> bool:
         """Delete a scheduled task by ID."""
-        async with self._telemetry.async_create_span("delete_scheduled_task") as span:
-            span.set_attribute("task_id", task_id)
-
+        async with self._telemetry.async_create_span(
+            "delete_scheduled_task",
+            attributes={
+                "task_id": task_id,
+            },
+        ) as span:
             try:
-                await self._ensure_connection()
-                async with self.conn.cursor() as cur:
+                async with self.pool.connection() as conn, conn.cursor() as cur:
                     await cur.execute("DELETE FROM scheduled_tasks WHERE task_id = %s", (task_id,))
                     rows = cur.rowcount
-                    await self.conn.commit()
+                    await conn.commit()
                     span.set_attribute("rows_affected", rows)
                     return rows > 0
             except Exception as e:
@@ -508,9 +564,8 @@ class WebStore:
                 return False
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the connection pool."""
         try:
-            if self.conn is not None:
-                await self.conn.close()
+            await self.pool.close()
         except Exception:
             pass